@@ -4,22 +4,339 @@ Enhanced LLM-powered job application processor that eliminates hardcoded pattern
 and uses AI for intelligent resume parsing and job information extraction.
 """
 import asyncio
+import dataclasses
+import functools
 import time
 import re
 import os
 import sys
 import json
-import urllib.parse
+import logging
+import logging.handlers
+import queue
+import hashlib
+import shutil
+import tempfile
+import threading
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.enums import TA_LEFT
+from llm_cover_letter import (
+    generate_llm_cover_letter, _api_backoff, _gemini_model, _is_transient_api_error, _json_dumps, _json_loads
+)
 
 # Load environment variables from .env file
 load_dotenv(override=True)  # Force override system environment variables
 
+# Per-call LLM diagnostics go through logging; __main__ routes records through
+# a queue so handler I/O happens off the calling threads/event loop
+logger = logging.getLogger(__name__)
+
+def _configure_logging(level=None):
+    """
+    Send log records to stderr from a single background QueueListener.
+    
+    Workers only enqueue records, so concurrent URLs never contend for the
+    stream lock. level defaults to LOG_LEVEL (INFO).
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level or os.getenv('LOG_LEVEL', 'INFO').upper())
+    listener.start()
+    return listener
+
+# Formatting config files, resolved once at import
+_CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'AllMyStuff')
+PDF_CONFIG_PATH = os.path.join(_CONFIG_DIR, 'pdf_config.json')
+COVER_LETTER_CONFIG_PATH = os.path.join(_CONFIG_DIR, 'cover_letter_config.json')
+
+@functools.lru_cache(maxsize=None)
+def _load_json_config(config_path):
+    """Parse a JSON config file once per process; None when the file doesn't exist."""
+    try:
+        with open(config_path, 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+
+def _read_resume_bytes(path):
+    """
+    Read a resume file's bytes (callers hash and/or decode them once).
+    CRLF and CR line endings become LF as in text mode, so Windows-saved
+    resumes hash, cache and match section headings like any other.
+    """
+    with open(path, 'rb') as f:
+        return f.read().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+def _write_text(path, text):
+    """Write text as UTF-8 bytes in one write call, skipping the text-mode encoder/newline layer."""
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+# On-disk cache for LLM responses (identical prompts skip the LLM entirely)
+LLM_CACHE_DIR = os.getenv('LLM_CACHE_DIR', '.llm_cache')
+LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', str(7 * 24 * 3600)))  # seconds
+# A job URL seen within this window reuses its scraped page and job details
+# without launching a browser (postings change, so this is kept short)
+JOB_PAGE_CACHE_TTL = int(os.getenv('JOB_PAGE_CACHE_TTL', str(24 * 3600)))  # seconds
+# Near-duplicate inputs (reposted jobs, lightly edited resumes) reuse a cached
+# response when their word-shingle Jaccard similarity reaches this threshold
+LLM_SIMILARITY_THRESHOLD = float(os.getenv('LLM_SIMILARITY_THRESHOLD', '0.95'))
+# Most recent inputs kept per model/extraction kind in the near-duplicate index
+LLM_SIMILARITY_MAX_ENTRIES = int(os.getenv('LLM_SIMILARITY_MAX_ENTRIES', '200'))
+_WORD_RE = re.compile(r'\w+')
+# Serializes read-modify-write updates of the shared cache index files
+_CACHE_INDEX_LOCK = threading.Lock()
+
+# Hosted LLM APIs: per-request timeout (seconds) and attempts on timeouts/transient errors
+API_REQUEST_TIMEOUT = float(os.getenv('API_REQUEST_TIMEOUT', '30'))
+API_MAX_ATTEMPTS = int(os.getenv('API_MAX_ATTEMPTS', '3'))
+# Prompt token budgets for scraped page text (leaves headroom for system prompt + instructions)
+JOB_CONTENT_MAX_TOKENS = int(os.getenv('JOB_CONTENT_MAX_TOKENS', '1500'))
+BODY_TEXT_MAX_TOKENS = int(os.getenv('BODY_TEXT_MAX_TOKENS', '2400'))
+# A fused resume + job prompt that can't carry this much page text within a
+# local model's context is split into separate resume and job calls
+_MIN_FUSED_PAGE_TOKENS = 400
+_token_encoding = None
+
+def _get_token_encoding():
+    """tiktoken's cl100k_base encoding, or False when tiktoken isn't installed."""
+    global _token_encoding
+    if _token_encoding is None:
+        try:
+            import tiktoken
+            _token_encoding = tiktoken.get_encoding('cl100k_base')
+        except Exception:
+            _token_encoding = False  # tiktoken unavailable - use the estimate from now on
+    return _token_encoding
+
+def _count_tokens(text):
+    """Approximate token count of text, measured the same way as _truncate_to_tokens."""
+    encoding = _get_token_encoding()
+    return len(encoding.encode(text)) if encoding else len(text) // 4 + 1
+
+def _truncate_to_tokens(text, max_tokens):
+    """
+    Trim text to at most max_tokens tokens.
+    Uses tiktoken's cl100k_base encoding when installed; otherwise estimates
+    ~4 characters per token and cuts at the last whitespace boundary.
+    Returns (text, was_truncated).
+    """
+    encoding = _get_token_encoding()
+    if encoding:
+        token_ids = encoding.encode(text)
+        if len(token_ids) <= max_tokens:
+            return text, False
+        return encoding.decode(token_ids[:max_tokens]), True
+    
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text, False
+    cut = text.rfind(' ', 0, max_chars)
+    return text[:cut if cut > 0 else max_chars], True
+
+# Filename sanitization: drop anything but word chars/whitespace/dashes, then
+# collapse dash/whitespace runs into a single underscore
+_FILENAME_INVALID_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+def _field_text(value, default):
+    """Coerce an LLM-extracted field (which may come back as a list or non-string) to text."""
+    if isinstance(value, list):
+        return value[0] if value else default
+    if not isinstance(value, str):
+        return str(value) if value else default
+    return value
+
+def _clean_filename_part(text):
+    """Make a string safe to use as part of a file or folder name."""
+    return _FILENAME_SEPARATOR_RE.sub('_', _FILENAME_INVALID_RE.sub('', text).strip())
+
+# First short (< 50 chars), multi-word line that isn't a greeting/closing/header -
+# used to recover the applicant's name from a cover letter
+_NAME_LINE_RE = re.compile(
+    r'^[ \t]*(?![^\n]*(?:dear|hiring|manager|sincerely|regards|best|quick|hits))'
+    r'(?=[^\n]{1,49}$)(?P<first>\S+)(?:[ \t]+\S+)*?[ \t]+(?P<last>\S+)[ \t]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# CSS selectors probed (in priority order) for the job description on a posting page
+JOB_DESCRIPTION_SELECTORS = [
+    # Specific job description selectors
+    '[data-testid="job-description"]',
+    '.job-description',
+    '[id*="job-description"]',
+    '[class*="job-description"]',
+    '[data-testid="jobDescription"]',
+    
+    # Content area selectors
+    '.content',
+    '[data-testid="content"]',
+    'main',
+    '.application-content',
+    '#content',
+    '.job-details',
+    '.position-details',
+    
+    # Greenhouse specific
+    '.application-question',
+    '.job-post',
+    '#main-content',
+    
+    # Generic content areas
+    'article',
+    '.job-posting',
+    '.posting-requirements'
+]
+
+# Returns the first selector whose element has substantial (> 150 chars) text
+_FIRST_SUBSTANTIAL_TEXT_JS = """(selectors) => {
+    for (const selector of selectors) {
+        try {
+            const el = document.querySelector(selector);
+            const text = el && el.innerText ? el.innerText.trim() : '';
+            if (text.length > 150) return {selector: selector, text: text};
+        } catch (e) {}
+    }
+    return null;
+}"""
+
+# Resume section headings. Only sections the extraction prompt asks about are
+# sent to the LLM; projects, references, interests etc. are dropped
+_RESUME_HEADING_RE = re.compile(
+    r'^[ \t#*]*(?P<heading>professional summary|summary|profile|objective|about me|'
+    r'(?:professional |work )?experience|employment(?: history)?|work history|education|'
+    r'(?:technical |core )?skills|core competencies|certifications?|licenses|'
+    r'projects|references|interests|hobbies|publications|volunteer(?:ing)?|awards|achievements|accomplishments)[ \t*:]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_RESUME_KEPT_SECTIONS = ('summary', 'profile', 'objective', 'about', 'experience', 'employment',
+                         'work history', 'education', 'skill', 'competenc', 'certif', 'licens')
+
+def _resume_prompt_text(resume_text):
+    """
+    Reduce a resume to the header (name/contact) plus the labeled sections
+    the extraction needs. Resumes without recognizable headings are sent whole.
+    """
+    matches = list(_RESUME_HEADING_RE.finditer(resume_text))
+    if not matches:
+        return resume_text
+    
+    parts = [resume_text[:matches[0].start()].strip()]
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        heading = match.group('heading').strip()
+        if not any(keyword in heading.lower() for keyword in _RESUME_KEPT_SECTIONS):
+            continue
+        end = next_match.start() if next_match else len(resume_text)
+        parts.append(f"{heading.upper()}:\n{resume_text[match.end():end].strip()}")
+    return '\n\n'.join(part for part in parts if part)
+
+# Opening ```/```json and closing ``` markdown fences around an LLM reply
+_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+# Fixed system prompts, built once. The JSON extraction prompts carry the
+# "JSON only" instruction themselves, so nothing is appended per call
+_JSON_ONLY_INSTRUCTION = "IMPORTANT: Return only valid JSON, no additional text or markdown formatting."
+RESUME_SYSTEM_PROMPT = f"""You are an expert resume parser. Extract key information from resumes and return it as JSON.
+Focus on identifying the candidate's name, contact information, and professional details.
+{_JSON_ONLY_INSTRUCTION}"""
+JOB_SYSTEM_PROMPT = f"""You are an expert at extracting job information from URLs, page titles, and job descriptions.
+Extract key details and return them as structured JSON.
+{_JSON_ONLY_INSTRUCTION}"""
+COMBINED_SYSTEM_PROMPT = f"""You are an expert resume parser and job posting analyst. Extract key information
+from a resume and a job posting in a single pass and return both as one JSON object.
+{_JSON_ONLY_INSTRUCTION}"""
+_JSON_SYSTEM_PROMPTS = frozenset({RESUME_SYSTEM_PROMPT, JOB_SYSTEM_PROMPT, COMBINED_SYSTEM_PROMPT})
+
+def _has_expected_fields(result, system_prompt):
+    """
+    True when an extraction result is a JSON object with the fields its prompt asks for.
+    Anything else (e.g. the {"content": ...} fallback for a reply that wasn't valid
+    JSON) is never cached or used.
+    """
+    if not isinstance(result, dict):
+        return False
+    if system_prompt == COMBINED_SYSTEM_PROMPT:
+        return (_has_expected_fields(result.get('resume'), RESUME_SYSTEM_PROMPT) and
+                _has_expected_fields(result.get('job'), JOB_SYSTEM_PROMPT))
+    if system_prompt == RESUME_SYSTEM_PROMPT:
+        return bool(result.get('name'))
+    if system_prompt == JOB_SYSTEM_PROMPT:
+        return bool(result.get('job_title') or result.get('company'))
+    return True
+
+# Extract an uncached resume together with the job in one LLM call (FUSED_EXTRACTION=1)
+# instead of two separate calls
+FUSED_EXTRACTION = os.getenv('FUSED_EXTRACTION', '0') == '1'
+
+# Fields requested from the resume and job extraction prompts
+_RESUME_FIELDS = """- "name": Full name of the candidate
+- "email": Email address  
+- "phone": Phone number (if available)
+- "location": Location/address (if available)
+- "title": Current/target job title or professional summary
+- "experience_summary": Brief summary of key experience and skills
+- "years_experience": Estimated years of experience (number)
+- "key_skills": Array of top 5-7 key technical/professional skills
+- "education": Highest degree or relevant education
+- "certifications": Any relevant certifications (array)"""
+_JOB_DESCRIPTION_FIELD = '''- "description": A condensed job description (at most 200 words) covering the role, responsibilities and requirements from the page text - summarize rather than copy it, and leave out navigation, ads, and footer content'''
+_JOB_FIELDS = """- "job_title": The specific job title/position name
+- "company": Company name
+- "location": Job location (city, state, remote, etc.)
+- "employment_type": Full-time, Part-time, Contract, etc.
+- "experience_level": Entry, Mid, Senior, Executive, etc.
+- "department": Engineering, Marketing, Sales, etc.
+- "salary_range": If mentioned (or "Not specified")
+- "remote_options": Remote, Hybrid, On-site, or "Not specified"
+- "key_requirements": Array of 3-5 main requirements/qualifications
+- "key_responsibilities": Array of 3-5 main job responsibilities
+- "required_skills": Array of technical/professional skills mentioned
+- "company_description": Brief description of the company (if available)"""
+
+# PDF rendering is CPU-bound ReportLab work. A single letter renders in a few
+# ms in-process, far less than spawning a worker costs, so only batch runs use
+# a process pool (sized by process_many) to render concurrent URLs on separate cores
+PDF_WORKERS = int(os.getenv('PDF_WORKERS', str(os.cpu_count() or 1)))
+_pdf_pool_workers = 0
+
+# Cover letter markdown markers and layout parser states
+_QUICK_HITS_MARKER = "**Quick Hits:**"
+_SIGNATURE_MARKER = "thanks,"
+_STATE_BODY = 'body'
+_STATE_QUICK_HITS = 'quick_hits'
+
+# Page body text with site chrome (navigation, banners, footers, sidebars, modals)
+# removed, so the LLM's token budget goes to the posting itself. Elements inside
+# main/article are kept since postings often put the title in a <header> there.
+# The page is discarded after scraping, so the live DOM is modified directly;
+# falls back to the full body text if stripping leaves too little.
+_BODY_TEXT_WITHOUT_BOILERPLATE_JS = """() => {
+    const fullText = document.body.innerText;
+    const boilerplate = 'nav, header, footer, aside, script, style, noscript, ' +
+        '[role=navigation], [role=banner], [role=contentinfo], [role=dialog], [aria-modal=true]';
+    for (const el of document.body.querySelectorAll(boilerplate)) {
+        if (!el.closest('main, article')) el.remove();
+    }
+    const text = document.body.innerText;
+    return text && text.trim().length > 300 ? text : fullText;
+}"""
+
 class LLMJobProcessor:
     """Enhanced job processor using LLM for all extraction and generation tasks."""
     
@@ -37,34 +354,69 @@ class LLMJobProcessor:
         self.tier1_provider = self.tier1_provider.lower()
         self.tier2_provider = self.tier2_provider.lower()
         
+        # Ollama only serves requests concurrently when the server is started with
+        # OLLAMA_NUM_PARALLEL; mirror that limit client-side so batched prompts
+        # are dispatched all at once without overrunning the server queue
+        self.num_parallel = int(os.getenv('OLLAMA_NUM_PARALLEL', '4'))
+        # Keep the model resident between pipeline steps so later calls skip the load
+        self.keep_alive = os.getenv('OLLAMA_KEEP_ALIVE', '30m')
+        self.num_ctx = int(os.getenv('OLLAMA_NUM_CTX', '4096'))
+        self.num_predict = int(os.getenv('OLLAMA_NUM_PREDICT', '512'))
+        # Output budget for the larger replies: raw-page extraction (which also writes the
+        # condensed description) and fused resume + job extraction
+        self.num_predict_long = int(os.getenv('OLLAMA_NUM_PREDICT_LONG', str(2 * self.num_predict)))
+        if 'OLLAMA_NUM_PARALLEL' not in os.environ and 'ollama' in (self.tier1_provider, self.tier2_provider):
+            logger.warning("   ⚠️ OLLAMA_NUM_PARALLEL is not set - the Ollama server may process prompts one at a time")
+        self._llm_semaphore = asyncio.Semaphore(self.num_parallel)
+        
+        # One pooled keep-alive session for every local LLM request instead of a
+        # fresh TCP connection per call; sized for the concurrent async callers.
+        # Transient failures (model still loading, connection refused) are retried
+        # with exponential backoff instead of failing the whole pipeline. Read
+        # timeouts are not - the /api/chat POST may still be running on the server
+        self._session = requests.Session()
+        self._session.headers['Connection'] = 'keep-alive'
+        retries = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=['GET', 'POST'],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retries)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
         # Initialize provider configurations dynamically
         self._init_provider_configs()
         
-        print(f"   🎯 Tier 1 LLM (Cover Letters): {self.tier1_provider}")
-        print(f"   🔍 Tier 2 LLM (Web Scraping): {self.tier2_provider}")
+        logger.info(f"   🎯 Tier 1 LLM (Cover Letters): {self.tier1_provider}")
+        logger.info(f"   🔍 Tier 2 LLM (Web Scraping): {self.tier2_provider}")
         self._print_provider_details()
     
     def _init_provider_configs(self):
-        """Initialize provider configurations for both tiers."""
-        # Initialize Tier 1 LLM configuration
-        self._init_Tier1LLM_config()
-        
-        # Initialize Tier 2 LLM configuration (only if different from Tier 1)
-        if self.tier2_provider != self.tier1_provider:
-            self._init_Tier2LLM_config()
-    
-    def _init_Tier1LLM_config(self):
-        """Initialize Tier 1 LLM configuration dynamically based on provider from .env."""
-        self._init_tier_config(1, self.tier1_provider)
-    
-    def _init_Tier2LLM_config(self):
-        """Initialize Tier 2 LLM configuration dynamically based on provider from .env."""
-        # Only initialize if different from Tier 1 to avoid duplicate initialization
-        if self.tier2_provider != self.tier1_provider:
-            self._init_tier_config(2, self.tier2_provider)
-    
-    def _init_tier_config(self, tier, provider):
-        """Dynamically initialize any provider configuration based on .env file."""
+        """
+        Initialize provider configurations for both tiers.
+        
+        Each provider is configured once in self._providers; self._tier maps a
+        tier number onto its provider's config, so tiers sharing a provider
+        share the same client.
+        """
+        self._providers = {}
+        for tier, provider in ((1, self.tier1_provider), (2, self.tier2_provider)):
+            if provider not in self._providers:
+                self._providers[provider] = self._init_provider_config(tier, provider)
+        
+        self._tier = {1: self._providers[self.tier1_provider], 2: self._providers[self.tier2_provider]}
+    
+    def _init_provider_config(self, tier, provider):
+        """
+        Dynamically initialize any provider configuration based on .env file.
+        
+        Returns:
+            dict: 'model' plus either 'api_key'/'client' (API services) or 'base_url' (local services)
+        """
         provider_upper = provider.upper()
         
         # Dynamic environment variable lookup - let .env file drive everything
@@ -80,43 +432,30 @@ class LLMJobProcessor:
         
         if api_key:
             # This is an API-based service (external APIs)
-            if not api_key:
-                raise ValueError(f"{api_key_key} must be set in .env file for Tier {tier}")
-            
-            # Store with generic tier-based naming
-            setattr(self, f'tier{tier}_api_key', api_key)
-            setattr(self, f'tier{tier}_model', model or f'{provider}-default-model')
+            config = {'api_key': api_key, 'model': model or f'{provider}-default-model'}
             
             # Initialize API client dynamically based on provider
-            # Use environment variable pattern to determine provider type
-            provider_upper = provider.upper()
-            if os.getenv(f'{provider_upper}_API_KEY'):
-                # Configure based on known API patterns
-                if 'gemini' in provider.lower():
-                    try:
-                        import google.generativeai as genai
-                        genai.configure(api_key=api_key)
-                        setattr(self, f'tier{tier}_client', genai.GenerativeModel(model or f'{provider}-default'))
-                    except ImportError:
-                        raise ValueError("google-generativeai package is required. Install with: pip install google-generativeai")
-                # Add other API-based providers here as needed
-                # elif 'openai' in provider.lower():
-                #     # Add OpenAI configuration here
-                #     pass
+            if 'gemini' in provider.lower():
+                try:
+                    import google.generativeai as genai
+                    config['client'] = _gemini_model(genai, model or f'{provider}-default', api_key)
+                except ImportError:
+                    raise ValueError("google-generativeai package is required. Install with: pip install google-generativeai")
+            # Add other API-based providers here as needed
+            # elif 'openai' in provider.lower():
+            #     # Add OpenAI configuration here
+            #     pass
             else:
                 # Generic API client initialization for unknown providers
-                setattr(self, f'tier{tier}_client', {'api_key': api_key, 'model': model})
+                config['client'] = {'api_key': api_key, 'model': model}
+            return config
             
         elif base_url:
             # This is a local/self-hosted service
-            if not base_url:
-                raise ValueError(f"{base_url_key} or {host_key} must be set in .env file for Tier {tier}")
             if not model:
                 raise ValueError(f"{model_key} must be set in .env file for Tier {tier}")
             
-            # Store with generic tier-based naming
-            setattr(self, f'tier{tier}_base_url', base_url)
-            setattr(self, f'tier{tier}_model', model)
+            return {'base_url': base_url, 'model': model}
             
         else:
             raise ValueError(f"No valid configuration found for {provider}. Need either {api_key_key} or {base_url_key}/{host_key} in .env file")
@@ -126,105 +465,296 @@ class LLMJobProcessor:
         # Print details for each tier dynamically
         for tier in [1, 2]:
             provider = self.tier1_provider if tier == 1 else self.tier2_provider
-            
-            # Check what configuration exists for this tier
-            model_attr = f'tier{tier}_model'
-            if hasattr(self, model_attr):
-                model_value = getattr(self, model_attr)
-                print(f"   🔗 Tier {tier} ({provider.title()}) model: {model_value}")
+            logger.info(f"   🔗 Tier {tier} ({provider.title()}) model: {self._tier[tier]['model']}")
         
-    def _call_llm(self, prompt, system_prompt=None, tier=2):
+    def _call_llm(self, prompt, system_prompt=None, tier=2, similarity_text=None, num_predict=None):
         """
         Call the appropriate LLM based on tier - completely dynamic.
         tier=1: Use Tier 1 LLM (high-quality for cover letters)
         tier=2: Use Tier 2 LLM (cost-effective for parsing/scraping)
+        similarity_text: the variable input of the prompt (e.g. resume text); enables
+        the near-duplicate cache so lightly edited inputs reuse a previous response
+        num_predict: local LLM output token budget (defaults to OLLAMA_NUM_PREDICT)
         """
         provider = self.tier1_provider if tier == 1 else self.tier2_provider
         
         # Dynamic tier-based method dispatch
-        return self._call_tier_llm(tier, provider, prompt, system_prompt)
+        return self._call_tier_llm(tier, provider, prompt, system_prompt, similarity_text, num_predict)
     
-    def _call_tier_llm(self, tier, provider, prompt, system_prompt=None):
+    async def _call_llm_async(self, prompt, system_prompt=None, tier=2, similarity_text=None, num_predict=None):
+        """
+        Awaitable variant of _call_llm for use inside the async pipeline.
+        The blocking provider call runs in a worker thread so independent
+        LLM requests can overlap instead of stalling the event loop.
+        """
+        provider = self.tier1_provider if tier == 1 else self.tier2_provider
+        async with self._llm_semaphore:
+            # API clients with a native coroutine (Gemini) are awaited directly
+            if hasattr(self._tier[tier].get('client'), 'generate_content_async'):
+                return await self._call_tier_llm_async(tier, provider, prompt, system_prompt, similarity_text)
+            return await asyncio.to_thread(self._call_llm, prompt, system_prompt, tier, similarity_text, num_predict)
+    
+    def _call_tier_llm(self, tier, provider, prompt, system_prompt=None, similarity_text=None, num_predict=None):
         """Dynamically call any LLM provider based on tier configuration."""
         try:
-            model_attr = f'tier{tier}_model'
-            model = getattr(self, model_attr)
-            
-            print(f"   🤖 Using Tier {tier} LLM ({provider.title()}): {model}")
+            cache_key, cached = self._cached_tier_response(tier, provider, prompt, system_prompt, similarity_text)
+            if cached is not None:
+                return cached, True
             
             # Check if this is an API-based service or local service
-            api_key_attr = f'tier{tier}_api_key'
-            base_url_attr = f'tier{tier}_base_url'
-            client_attr = f'tier{tier}_client'
+            config = self._tier[tier]
             
-            if hasattr(self, api_key_attr):
+            if 'api_key' in config:
                 # API-based service
-                return self._call_api_service(tier, provider, prompt, system_prompt)
-            elif hasattr(self, base_url_attr):
+                result, success = self._call_api_service(tier, provider, prompt, system_prompt)
+            elif 'base_url' in config:
                 # Local/self-hosted service
-                return self._call_local_service(tier, provider, prompt, system_prompt)
+                result, success = self._call_local_service(tier, provider, prompt, system_prompt, num_predict)
             else:
                 raise ValueError(f"No valid configuration found for Tier {tier} ({provider})")
+            
+            self._store_tier_response(tier, cache_key, result, success, system_prompt, similarity_text)
+            return result, success
                 
         except Exception as e:
-            print(f"   ⚠️ Tier {tier} LLM ({provider}) call failed: {e}")
+            logger.warning(f"   ⚠️ Tier {tier} LLM ({provider}) call failed: {e}")
+            return None, False
+    
+    async def _call_tier_llm_async(self, tier, provider, prompt, system_prompt=None, similarity_text=None):
+        """Async counterpart of _call_tier_llm for API clients with a native coroutine."""
+        try:
+            cache_key, cached = await asyncio.to_thread(
+                self._cached_tier_response, tier, provider, prompt, system_prompt, similarity_text
+            )
+            if cached is not None:
+                return cached, True
+            
+            result, success = await self._call_api_service_async(tier, provider, prompt, system_prompt)
+            await asyncio.to_thread(
+                self._store_tier_response, tier, cache_key, result, success, system_prompt, similarity_text
+            )
+            return result, success
+        
+        except Exception as e:
+            logger.warning(f"   ⚠️ Tier {tier} LLM ({provider}) call failed: {e}")
             return None, False
     
+    def _cached_tier_response(self, tier, provider, prompt, system_prompt=None, similarity_text=None):
+        """
+        Look up a cached response for this tier's model.
+        
+        Returns:
+            tuple: (cache_key, cached_result) - cached_result is None on a miss
+        """
+        model = self._tier[tier]['model']
+        
+        # Identical (model, system prompt, prompt) triples are answered from the cache
+        cache_key = self._llm_cache_key(model, prompt, system_prompt)
+        cached = self._llm_cache_get(cache_key)
+        if cached is None and similarity_text:
+            cached = self._similar_cache_get(model, system_prompt, similarity_text)
+        if cached is not None and not _has_expected_fields(cached, system_prompt):
+            cached = None  # An unusable entry written before results were validated
+        if cached is not None:
+            logger.debug(f"   ♻️ Using cached Tier {tier} LLM response ({provider.title()}): {model}")
+        else:
+            logger.debug(f"   🤖 Using Tier {tier} LLM ({provider.title()}): {model}")
+        return cache_key, cached
+    
+    def _store_tier_response(self, tier, cache_key, result, success, system_prompt=None, similarity_text=None):
+        """Cache a successful, well-formed response and index it for near-duplicate lookups."""
+        if success and _has_expected_fields(result, system_prompt):
+            self._llm_cache_set(cache_key, result)
+            if similarity_text:
+                model = self._tier[tier]['model']
+                self._similar_cache_add(model, system_prompt, similarity_text, cache_key)
+    
+    def _llm_cache_key(self, model, prompt, system_prompt=None):
+        """Hash the model and whitespace-normalized prompts into a stable cache key."""
+        normalized = '|'.join([
+            model or '',
+            ' '.join((system_prompt or '').split()),
+            ' '.join(prompt.split())
+        ])
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
+    def _llm_cache_get(self, key, ttl=None):
+        """Return a cached LLM response, or None when missing or older than ttl (default LLM_CACHE_TTL)."""
+        path = os.path.join(LLM_CACHE_DIR, f"{key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) > (LLM_CACHE_TTL if ttl is None else ttl):
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _llm_cache_set(self, key, value):
+        """Atomically store an LLM response in the cache; failures are non-fatal."""
+        try:
+            os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=LLM_CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, os.path.join(LLM_CACHE_DIR, f"{key}.json"))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"   ⚠️ Could not write LLM cache: {e}")
+    
+    def _shingles(self, text):
+        """Hash the word 3-grams of text into a set used for Jaccard similarity."""
+        words = _WORD_RE.findall(text.lower())
+        if len(words) < 3:
+            return {zlib.crc32(' '.join(words).encode('utf-8'))}
+        return {zlib.crc32(' '.join(words[i:i + 3]).encode('utf-8')) for i in range(len(words) - 2)}
+    
+    def _similarity_namespace(self, model, system_prompt):
+        """Scope near-duplicate lookups to one model and one kind of extraction."""
+        return self._llm_cache_key(model, '', system_prompt)
+    
+    def _load_similarity_index(self):
+        """Load the near-duplicate index: {namespace: [{"key": ..., "shingles": [...]}]}."""
+        try:
+            with open(os.path.join(LLM_CACHE_DIR, 'similarity_index.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _similar_cache_get(self, model, system_prompt, similarity_text):
+        """Return the cached response of the most similar previous input above the threshold."""
+        entries = self._load_similarity_index().get(self._similarity_namespace(model, system_prompt), [])
+        shingles = self._shingles(similarity_text)
+        matches = []
+        for entry in entries:
+            other = set(entry['shingles'])
+            score = len(shingles & other) / len(shingles | other)
+            if score >= LLM_SIMILARITY_THRESHOLD:
+                matches.append((score, entry['key']))
+        # An expired best match falls through to the next most similar live entry
+        for _, key in sorted(matches, reverse=True):
+            cached = self._llm_cache_get(key)
+            if cached is not None:
+                return cached
+        return None
+    
+    def _is_live_cache_entry(self, key):
+        """Whether the cached response for key still exists and is within LLM_CACHE_TTL."""
+        try:
+            return time.time() - os.path.getmtime(os.path.join(LLM_CACHE_DIR, f"{key}.json")) <= LLM_CACHE_TTL
+        except OSError:
+            return False
+    
+    def _similar_cache_add(self, model, system_prompt, similarity_text, cache_key):
+        """Register a cached response in the near-duplicate index, dropping expired and surplus entries."""
+        with _CACHE_INDEX_LOCK:
+            index = self._load_similarity_index()
+            namespace = self._similarity_namespace(model, system_prompt)
+            entries = [
+                e for e in index.get(namespace, [])
+                if e['key'] != cache_key and self._is_live_cache_entry(e['key'])
+            ]
+            entries.append({'key': cache_key, 'shingles': sorted(self._shingles(similarity_text))})
+            # Entries are appended in store order, so the oldest are dropped first
+            index[namespace] = entries[-LLM_SIMILARITY_MAX_ENTRIES:]
+            self._llm_cache_set('similarity_index', index)
+    
     def _call_api_service(self, tier, provider, prompt, system_prompt=None):
         """Call an API-based LLM service."""
-        client_attr = f'tier{tier}_client'
+        client = self._api_client(tier, provider)
         
-        if hasattr(self, client_attr):
-            client = getattr(self, client_attr)
-            
-            # Handle different types of API clients dynamically
-            if hasattr(client, 'generate_content'):
-                # This looks like a Google Generative AI client
-                full_prompt = prompt
-                if system_prompt:
-                    full_prompt = f"{system_prompt}\n\n{prompt}"
-                
-                # For JSON responses, add explicit instruction
-                if "Return a JSON object" in prompt or "as JSON" in prompt:
-                    full_prompt += "\n\nIMPORTANT: Return only valid JSON, no additional text or markdown formatting."
-                
-                response = client.generate_content(full_prompt)
-                
-                if response.text:
-                    content = response.text.strip()
-                    
-                    # Clean up potential markdown formatting
-                    if content.startswith("```json"):
-                        content = content.replace("```json", "").replace("```", "").strip()
-                    elif content.startswith("```"):
-                        content = content.replace("```", "").strip()
-                    
-                    try:
-                        # Try to parse as JSON first
-                        return json.loads(content), True
-                    except json.JSONDecodeError:
-                        # If JSON parsing fails, return raw content
-                        return {"content": content}, True
-                else:
-                    print(f"   ⚠️ Tier {tier} API returned empty response")
-                    return None, False
-            else:
-                # Generic API client handling for unknown providers
-                print(f"   ⚠️ Generic API client not yet implemented for {provider}")
-                return None, False
+        # Handle different types of API clients dynamically
+        if hasattr(client, 'generate_content'):
+            # This looks like a Google Generative AI client
+            full_prompt = self._api_prompt(prompt, system_prompt)
+            generation_config = self._api_generation_config(system_prompt)
+            # A stuck request is abandoned after API_REQUEST_TIMEOUT and retried
+            for attempt in range(1, API_MAX_ATTEMPTS + 1):
+                try:
+                    response = client.generate_content(
+                        full_prompt,
+                        generation_config=generation_config,
+                        request_options={'timeout': API_REQUEST_TIMEOUT}
+                    )
+                    return self._api_result(tier, response)
+                except Exception as e:
+                    if attempt == API_MAX_ATTEMPTS or not _is_transient_api_error(e):
+                        raise
+                    logger.warning(f"   ⚠️ Tier {tier} API attempt {attempt} failed ({type(e).__name__}) - retrying")
+                    time.sleep(_api_backoff(attempt))
         else:
+            # Generic API client handling for unknown providers
+            logger.warning(f"   ⚠️ Generic API client not yet implemented for {provider}")
+            return None, False
+    
+    async def _call_api_service_async(self, tier, provider, prompt, system_prompt=None):
+        """Call an API-based LLM service without blocking the event loop."""
+        client = self._api_client(tier, provider)
+        full_prompt = self._api_prompt(prompt, system_prompt)
+        generation_config = self._api_generation_config(system_prompt)
+        for attempt in range(1, API_MAX_ATTEMPTS + 1):
+            try:
+                response = await asyncio.wait_for(
+                    client.generate_content_async(
+                        full_prompt,
+                        generation_config=generation_config,
+                        request_options={'timeout': API_REQUEST_TIMEOUT}
+                    ),
+                    timeout=API_REQUEST_TIMEOUT
+                )
+                return self._api_result(tier, response)
+            except Exception as e:
+                if attempt == API_MAX_ATTEMPTS or not _is_transient_api_error(e):
+                    raise
+                logger.warning(f"   ⚠️ Tier {tier} API attempt {attempt} failed ({type(e).__name__}) - retrying")
+                await asyncio.sleep(_api_backoff(attempt))
+    
+    def _api_client(self, tier, provider):
+        """Return the configured API client for a tier."""
+        client = self._tier[tier].get('client')
+        if client is None:
             raise ValueError(f"No client found for Tier {tier} ({provider})")
+        return client
     
-    def _call_local_service(self, tier, provider, prompt, system_prompt=None):
-        """Call a local/self-hosted LLM service."""
-        try:
-            import requests
+    def _api_generation_config(self, system_prompt):
+        """Ask the API for raw JSON (no markdown fences) for the JSON extraction prompts."""
+        if system_prompt in _JSON_SYSTEM_PROMPTS:
+            return {"response_mime_type": "application/json"}
+        return None
+    
+    def _api_prompt(self, prompt, system_prompt=None):
+        """Fold the system prompt into a single prompt for generate_content-style APIs."""
+        if system_prompt:
+            return f"{system_prompt}\n\n{prompt}"
+        return prompt
+    
+    def _api_result(self, tier, response):
+        """Parse an API response into (result, success)."""
+        # A reply cut off at the output token limit is incomplete JSON - never use it
+        candidates = getattr(response, 'candidates', None)
+        if candidates and getattr(candidates[0].finish_reason, 'name', None) == 'MAX_TOKENS':
+            logger.warning(f"   ⚠️ Tier {tier} API reply hit the output token limit and was truncated")
+            return None, False
+        if response.text:
+            content = response.text.strip()
             
-            base_url_attr = f'tier{tier}_base_url'
-            model_attr = f'tier{tier}_model'
+            # Clean up potential markdown formatting (JSON mode normally returns bare JSON)
+            if content.startswith("```"):
+                content = _FENCE_RE.sub('', content).strip()
             
-            base_url = getattr(self, base_url_attr)
-            model = getattr(self, model_attr)
+            try:
+                # Try to parse as JSON first
+                return _json_loads(content), True
+            except json.JSONDecodeError:
+                # If JSON parsing fails, return raw content
+                return {"content": content}, True
+        else:
+            logger.warning(f"   ⚠️ Tier {tier} API returned empty response")
+            return None, False
+    
+    def _call_local_service(self, tier, provider, prompt, system_prompt=None, num_predict=None):
+        """Call a local/self-hosted LLM service."""
+        try:
+            base_url = self._tier[tier]['base_url']
+            model = self._tier[tier]['model']
             
             messages = []
             if system_prompt:
@@ -235,37 +765,58 @@ class LLMJobProcessor:
             payload = {
                 "model": model,
                 "messages": messages,
-                "stream": False,
-                "format": "json"
+                "stream": True,
+                "format": "json",
+                "keep_alive": self.keep_alive,
+                "options": {
+                    "num_ctx": self.num_ctx,
+                    "num_predict": num_predict or self.num_predict
+                }
             }
             
-            response = requests.post(
+            # Stream the reply so decoding progress is consumed as it arrives
+            # (the timeout applies between chunks rather than to the whole generation)
+            with self._session.post(
                 f"{base_url}/api/chat",
-                json=payload,
-                timeout=60
-            )
+                data=_json_dumps(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=60,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.warning(f"   ⚠️ Tier {tier} Local API error: {response.status_code}")
+                    return None, False
+                
+                chunks = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if chunk.get('error'):
+                        raise Exception(chunk['error'])
+                    chunks.append(chunk.get('message', {}).get('content', ''))
+                    if chunk.get('done'):
+                        # A reply cut off at num_predict is incomplete JSON - never use it
+                        if chunk.get('done_reason') == 'length':
+                            logger.warning(f"   ⚠️ Tier {tier} reply hit the {num_predict or self.num_predict}-token output limit and was truncated")
+                            return None, False
+                        break
             
-            if response.status_code == 200:
-                result = response.json()
-                content = result.get('message', {}).get('content', '')
-                try:
-                    return json.loads(content), True
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, return raw content
-                    return {"content": content}, True
-            else:
-                print(f"   ⚠️ Tier {tier} Local API error: {response.status_code}")
-                return None, False
+            content = ''.join(chunks)
+            try:
+                return _json_loads(content), True
+            except json.JSONDecodeError:
+                # If JSON parsing fails, return raw content
+                return {"content": content}, True
                 
-        except ImportError:
-            raise ValueError("requests package is required for local services. Install with: pip install requests")
         except Exception as e:
-            print(f"   ⚠️ Local service call failed: {e}")
+            logger.warning(f"   ⚠️ Local service call failed: {e}")
             return None, False
     
-    def _load_pdf_config(self):
+    @staticmethod
+    def _load_pdf_config():
         """Load PDF formatting configuration from config file."""
-        config_path = os.path.join(os.path.dirname(__file__), 'AllMyStuff', 'pdf_config.json')
+        config_path = PDF_CONFIG_PATH
         default_config = {
             "pdf_formatting": {
                 "page_size": "letter",
@@ -287,20 +838,20 @@ class LLMJobProcessor:
         }
         
         try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+            config = _load_json_config(config_path)
+            if config is not None:
                 return config.get('pdf_formatting', default_config['pdf_formatting'])
             else:
-                print(f"   ℹ️  PDF config not found, using defaults")
+                logger.info(f"   ℹ️  PDF config not found, using defaults")
                 return default_config['pdf_formatting']
         except Exception as e:
-            print(f"   ⚠️ Error loading PDF config: {e}, using defaults")
+            logger.warning(f"   ⚠️ Error loading PDF config: {e}, using defaults")
             return default_config['pdf_formatting']
     
-    def _load_cover_letter_config(self):
+    @staticmethod
+    def _load_cover_letter_config():
         """Load cover letter configuration from config file."""
-        config_path = os.path.join(os.path.dirname(__file__), 'AllMyStuff', 'cover_letter_config.json')
+        config_path = COVER_LETTER_CONFIG_PATH
         default_config = {
             "template_config": {
                 "structure": {
@@ -329,157 +880,141 @@ class LLMJobProcessor:
         }
         
         try:
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+            config = _load_json_config(config_path)
+            if config is not None:
                 return config.get('template_config', default_config['template_config'])
             else:
-                print(f"   ℹ️  Cover letter config not found, using defaults")
+                logger.info(f"   ℹ️  Cover letter config not found, using defaults")
                 return default_config['template_config']
         except Exception as e:
-            print(f"   ⚠️ Error loading cover letter config: {e}")
+            logger.warning(f"   ⚠️ Error loading cover letter config: {e}")
             return default_config['template_config']
 
-    def _parse_markdown_to_reportlab(self, text, body_style, bold_style):
+    @staticmethod
+    def _parse_markdown_to_reportlab(text, body_style, bold_style):
         """Parse markdown to create a professional cover letter layout using configuration."""
         # Load cover letter configuration
-        config = self._load_cover_letter_config()
+        config = LLMJobProcessor._load_cover_letter_config()
         quick_hits_config = config['structure']['quick_hits']
         signature_config = config['structure']['signature']
         
+        # Build every paragraph style once up front rather than per line/bullet
+        quick_hits_style = ParagraphStyle(
+            'QuickHitsHeader',
+            parent=body_style,
+            fontName='Helvetica-Bold',
+            fontSize=14,
+            spaceAfter=12,
+            spaceBefore=0
+        )
+        bullet_style = ParagraphStyle(
+            'BulletPoint',
+            parent=body_style,
+            fontName='Helvetica',
+            fontSize=11,
+            leftIndent=24,  # Indent for bullet
+            bulletIndent=12,  # Bullet position
+            spaceAfter=4,
+            spaceBefore=2
+        )
+        greeting_style = ParagraphStyle(
+            'Greeting',
+            parent=body_style,
+            fontName='Helvetica',
+            fontSize=11,
+            spaceAfter=12,
+            spaceBefore=0
+        )
+        signature_style = ParagraphStyle(
+            'Signature',
+            parent=body_style,
+            fontName='Helvetica',
+            fontSize=11,
+            spaceAfter=12,
+            spaceBefore=0
+        )
+        name_style = ParagraphStyle(
+            'Name',
+            parent=body_style,
+            fontName='Helvetica',
+            fontSize=11,
+            spaceAfter=4,
+            spaceBefore=0
+        )
+        contact_style = ParagraphStyle(
+            'ContactInfo',
+            parent=body_style,
+            fontName='Helvetica',
+            fontSize=10,
+            spaceAfter=2,
+            spaceBefore=0
+        )
+        paragraph_style = ParagraphStyle(
+            'BodyParagraph',
+            parent=body_style,
+            fontName='Helvetica',
+            fontSize=11,
+            spaceAfter=12,
+            spaceBefore=0,
+            alignment=TA_LEFT,
+            leading=16  # Line height
+        )
+        
+        # Single pass over pre-stripped lines. In the QUICK_HITS state the
+        # bullets/blank lines that follow the header are skipped, since the
+        # bullets come from config; the signature ends the letter.
         paragraphs = []
-        lines = text.split('\n')
-        i = 0
+        state = _STATE_BODY
         
-        while i < len(lines):
-            line = lines[i].strip()
+        for line in (raw_line.strip() for raw_line in text.splitlines()):
+            if state == _STATE_QUICK_HITS:
+                if line.startswith('* ') or not line:
+                    continue
+                state = _STATE_BODY
             
             # Handle Quick Hits section using config
-            if line == "**Quick Hits:**" and quick_hits_config['enabled']:
+            if line == _QUICK_HITS_MARKER and quick_hits_config['enabled']:
                 # Add Quick Hits header with bold formatting
-                quick_hits_style = ParagraphStyle(
-                    'QuickHitsHeader',
-                    parent=body_style,
-                    fontName='Helvetica-Bold',
-                    fontSize=14,
-                    spaceAfter=12,
-                    spaceBefore=0
-                )
                 paragraphs.append(Paragraph(quick_hits_config['title'], quick_hits_style))
                 
                 # Process bullet points from config instead of parsing text
                 for bullet_item in quick_hits_config['items']:
-                    bullet_style = ParagraphStyle(
-                        'BulletPoint',
-                        parent=body_style,
-                        fontName='Helvetica',
-                        fontSize=11,
-                        leftIndent=24,  # Indent for bullet
-                        bulletIndent=12,  # Bullet position
-                        spaceAfter=4,
-                        spaceBefore=2
-                    )
                     paragraphs.append(Paragraph(f"• {bullet_item}", bullet_style))
                 
-                # Skip past the bullet points in the text
-                i += 1
-                while i < len(lines):
-                    if lines[i].strip().startswith('* ') or lines[i].strip() == "":
-                        i += 1
-                    else:
-                        break
-                
                 # Add space after Quick Hits section
                 paragraphs.append(Spacer(1, 16))
-                continue
+                state = _STATE_QUICK_HITS
             
             # Handle Dear [Company] greeting
             elif line.startswith("Dear "):
-                greeting_style = ParagraphStyle(
-                    'Greeting',
-                    parent=body_style,
-                    fontName='Helvetica',
-                    fontSize=11,
-                    spaceAfter=12,
-                    spaceBefore=0
-                )
                 paragraphs.append(Paragraph(line, greeting_style))
             
-            # Handle signature section using config
-            elif line == "thanks,":
+            # Handle signature section using config - the text's own signature
+            # lines are replaced by the configured ones
+            elif line == _SIGNATURE_MARKER:
                 # Add space before signature
                 paragraphs.append(Spacer(1, 12))
                 
-                # Thanks line from config
-                signature_style = ParagraphStyle(
-                    'Signature',
-                    parent=body_style,
-                    fontName='Helvetica',
-                    fontSize=11,
-                    spaceAfter=12,
-                    spaceBefore=0
-                )
+                # Thanks line, name and contact info from config
                 paragraphs.append(Paragraph(signature_config['closing'], signature_style))
-                
-                # Add name from config
-                name_style = ParagraphStyle(
-                    'Name',
-                    parent=body_style,
-                    fontName='Helvetica',
-                    fontSize=11,
-                    spaceAfter=4,
-                    spaceBefore=0
-                )
                 paragraphs.append(Paragraph(signature_config['name'], name_style))
-                
-                # Add contact info from config
-                contact_style = ParagraphStyle(
-                    'ContactInfo',
-                    parent=body_style,
-                    fontName='Helvetica',
-                    fontSize=10,
-                    spaceAfter=2,
-                    spaceBefore=0
-                )
                 for contact_line in signature_config['contact_info']:
                     paragraphs.append(Paragraph(contact_line, contact_style))
-                
-                # Skip past signature lines in text since we're using config
-                i += 1
-                while i < len(lines):
-                    sig_line = lines[i].strip()
-                    if (sig_line and 
-                        (sig_line == signature_config['name'] or 
-                         any(contact in sig_line for contact in signature_config['contact_info']))):
-                        i += 1
-                    else:
-                        break
                 break
             
             # Handle regular paragraphs
             elif line and not line.startswith('*'):
                 # Regular paragraph with proper spacing
-                paragraph_style = ParagraphStyle(
-                    'BodyParagraph',
-                    parent=body_style,
-                    fontName='Helvetica',
-                    fontSize=11,
-                    spaceAfter=12,
-                    spaceBefore=0,
-                    alignment=TA_LEFT,
-                    leading=16  # Line height
-                )
                 paragraphs.append(Paragraph(line, paragraph_style))
-            
-            i += 1
         
         return paragraphs
 
-    def _generate_cover_letter_pdf(self, cover_letter_text, output_filename):
+    @staticmethod
+    def _generate_cover_letter_pdf(cover_letter_text, output_filename):
         """Generate a professional PDF cover letter with configurable formatting."""
         try:
             # Load configuration
-            config = self._load_pdf_config()
+            config = LLMJobProcessor._load_pdf_config()
             
             # Set up page size and margins
             page_size = letter  # Default to letter, could be extended to support other sizes
@@ -546,43 +1081,72 @@ class LLMJobProcessor:
             
             # Skip title to remove blank space at top - go directly to content
             # Parse markdown and add to story
-            story.extend(self._parse_markdown_to_reportlab(cover_letter_text, body_style, bold_style))
+            story.extend(LLMJobProcessor._parse_markdown_to_reportlab(cover_letter_text, body_style, bold_style))
 
             # Build PDF
             doc.build(story)
             return True
             
         except Exception as e:
-            print(f"   ⚠️ PDF generation failed: {e}")
+            logger.warning(f"   ⚠️ PDF generation failed: {e}")
             return False
     
+    @staticmethod
+    def _generate_cover_letter_pdf_cached(cover_letter_text, output_filename):
+        """
+        Generate the cover letter PDF, copying a previously rendered PDF when the
+        same letter was already rendered with the same PDF/cover letter config.
+        """
+        digest = hashlib.sha256(cover_letter_text.encode('utf-8'))
+        digest.update(_json_dumps([LLMJobProcessor._load_pdf_config(), LLMJobProcessor._load_cover_letter_config()]))
+        cached_pdf = os.path.join(LLM_CACHE_DIR, f"pdf_{digest.hexdigest()}.pdf")
+        
+        try:
+            shutil.copyfile(cached_pdf, output_filename)
+            logger.info(f"   ♻️ Reused previously rendered PDF")
+            return True
+        except FileNotFoundError:
+            pass
+        
+        if not LLMJobProcessor._generate_cover_letter_pdf(cover_letter_text, output_filename):
+            return False
+        
+        # Store a copy atomically so concurrent runs never see a partial PDF
+        try:
+            os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=LLM_CACHE_DIR, suffix='.tmp')
+            os.close(fd)
+            shutil.copyfile(output_filename, tmp_path)
+            os.replace(tmp_path, cached_pdf)
+        except OSError as e:
+            logger.warning(f"   ⚠️ Could not cache PDF: {e}")
+        return True
+    
     def _llm_extract_resume_info(self, resume_text):
         """Use LLM to intelligently extract resume information."""
-        system_prompt = """You are an expert resume parser. Extract key information from resumes and return it as JSON.
-        Focus on identifying the candidate's name, contact information, and professional details."""
+        user_prompt, system_prompt, similarity_text = self._resume_extraction_prompts(resume_text)
+        result, success = self._call_llm(user_prompt, system_prompt, tier=2, similarity_text=similarity_text)
+        return self._resume_info_from_result(resume_text, result, success)
+    
+    def _resume_extraction_prompts(self, resume_text):
+        """Build the (user_prompt, system_prompt, similarity_text) request for resume extraction."""
+        system_prompt = RESUME_SYSTEM_PROMPT
         
         user_prompt = f"""Please analyze this resume text and extract the following information as JSON:
 
 RESUME TEXT:
-{resume_text}
+{_resume_prompt_text(resume_text)}
 
 Return a JSON object with these fields:
-- "name": Full name of the candidate
-- "email": Email address  
-- "phone": Phone number (if available)
-- "location": Location/address (if available)
-- "title": Current/target job title or professional summary
-- "experience_summary": Brief summary of key experience and skills
-- "years_experience": Estimated years of experience (number)
-- "key_skills": Array of top 5-7 key technical/professional skills
-- "education": Highest degree or relevant education
-- "certifications": Any relevant certifications (array)
+{_RESUME_FIELDS}
 
 If information is not clearly available, use "Not specified" for text fields, 0 for years_experience, and empty arrays for lists."""
         
-        result, success = self._call_llm(user_prompt, system_prompt, tier=2)
-        
-        if success and result:
+        return user_prompt, system_prompt, resume_text
+    
+    def _resume_info_from_result(self, resume_text, result, success):
+        """Normalize an LLM resume extraction result into the resume_info structure."""
+        if success and _has_expected_fields(result, RESUME_SYSTEM_PROMPT):
             # Ensure we have the basic structure with fallbacks
             resume_info = {
                 'name': result.get('name', 'Candidate'),
@@ -597,25 +1161,132 @@ If information is not clearly available, use "Not specified" for text fields, 0
                 'certifications': result.get('certifications', []),
                 'full_content': resume_text
             }
-            print(f"   ✅ LLM extracted resume info for: {resume_info['name']}")
+            logger.info(f"   ✅ LLM extracted resume info for: {resume_info['name']}")
             return resume_info
         else:
             raise Exception("❌ LLM resume extraction failed. Please check your LLM connection and model availability.")
     
+    def _resume_cache_key(self, resume_bytes):
+        """Key parsed resume info by the resume's content and the parsing model."""
+        digest = hashlib.sha256(resume_bytes)
+        digest.update(b'|' + self._tier[2]['model'].encode('utf-8'))
+        return f"resume_{digest.hexdigest()}"
+    
+    def _get_cached_resume_info(self, resume_bytes):
+        """Return previously parsed resume info for identical resume content, else None."""
+        return self._llm_cache_get(self._resume_cache_key(resume_bytes))
+    
+    def _cache_resume_info(self, resume_bytes, resume_info):
+        """Remember parsed resume info for this exact resume content."""
+        self._llm_cache_set(self._resume_cache_key(resume_bytes), resume_info)
+    
+    async def _parse_resume_async(self, resume_path):
+        """Parse a resume file inside the async pipeline, reusing cached results."""
+        resume_bytes = await asyncio.to_thread(_read_resume_bytes, resume_path)
+        return await self._parse_resume_bytes_async(resume_bytes)
+    
+    async def _parse_resume_bytes_async(self, resume_bytes):
+        """Parse already-read resume bytes inside the async pipeline, reusing cached results."""
+        resume_info = self._get_cached_resume_info(resume_bytes)
+        if resume_info:
+            logger.info(f"   ♻️ Using cached resume info for: {resume_info['name']}")
+            return resume_info
+        
+        resume_text = resume_bytes.decode('utf-8')
+        
+        user_prompt, system_prompt, similarity_text = self._resume_extraction_prompts(resume_text)
+        result, success = await self._call_llm_async(user_prompt, system_prompt, 2, similarity_text)
+        resume_info = self._resume_info_from_result(resume_text, result, success)
+        self._cache_resume_info(resume_bytes, resume_info)
+        return resume_info
+    
     def _fallback_resume_parse(self, resume_text):
         """This method is removed - LLM-only approach."""
         raise Exception("❌ Resume parsing requires LLM. Fallback methods have been removed.")
 
     def _llm_extract_job_info(self, url, page_title, page_content=None):
         """Use LLM to intelligently extract job information from URL, title, and content."""
-        system_prompt = """You are an expert at extracting job information from URLs, page titles, and job descriptions.
-        Extract key details and return them as structured JSON."""
+        job_info = self._get_cached_job_info(url, page_content)
+        if job_info:
+            return job_info
+        
+        user_prompt, system_prompt, similarity_text = self._job_extraction_prompts(url, page_title, page_content)
+        result, success = self._call_llm(user_prompt, system_prompt, tier=2, similarity_text=similarity_text)
+        job_info = self._job_info_from_result(result, success)
+        self._cache_job_info(url, page_content, job_info)
+        return job_info
+    
+    def _job_cache_key(self, url, page_content):
+        """Key extracted job info by posting URL, page content and the parsing model."""
+        digest = hashlib.sha256(url.encode('utf-8'))
+        for part in (page_content or '', self._tier[2]['model']):
+            digest.update(b'|' + part.encode('utf-8'))
+        return f"job_{digest.hexdigest()}"
+    
+    def _get_cached_job_info(self, url, page_content):
+        """Return previously extracted job info for the same URL and page content, else None."""
+        job_info = self._llm_cache_get(self._job_cache_key(url, page_content))
+        if not _has_expected_fields(job_info, JOB_SYSTEM_PROMPT):
+            return None
+        logger.info(f"   ♻️ Using cached job info: {job_info.get('job_title', 'Unknown')} at {job_info.get('company', 'Unknown')}")
+        return job_info
+    
+    def _cache_job_info(self, url, page_content, job_info):
+        """Remember extracted job info for this URL and page content."""
+        self._llm_cache_set(self._job_cache_key(url, page_content), job_info)
+    
+    def _job_page_cache_key(self, url):
+        """Key a scraped job page and its extracted details by URL and the parsing model."""
+        digest = hashlib.sha256(f"{url}|{self._tier[2]['model']}".encode('utf-8'))
+        return f"jobpage_{digest.hexdigest()}"
+    
+    def _get_cached_job_page(self, url):
+        """Return the page title, description and job info cached for url within JOB_PAGE_CACHE_TTL, else None."""
+        cached = self._llm_cache_get(self._job_page_cache_key(url), JOB_PAGE_CACHE_TTL)
+        if not isinstance(cached, dict) or not _has_expected_fields(cached.get('job_info'), JOB_SYSTEM_PROMPT):
+            return None
+        return cached
+    
+    def _cache_job_page(self, url, page_title, job_description, job_info):
+        """Remember a scraped job page and its extracted details so a repeat URL skips the browser."""
+        self._llm_cache_set(self._job_page_cache_key(url), {
+            'page_title': page_title,
+            'description': job_description,
+            'job_info': job_info
+        })
+    
+    def _job_content_section(self, page_content, raw_page=False, max_tokens=None):
+        """
+        Format scraped page text for a job extraction prompt.
         
-        content_section = ""
-        if page_content:
-            # Limit content size for LLM processing
-            content_preview = page_content[:2000] + "..." if len(page_content) > 2000 else page_content
-            content_section = f"\nPAGE CONTENT:\n{content_preview}"
+        max_tokens: a tighter page text budget than the configured default
+        
+        Returns:
+            tuple: (content_section, job_fields) - raw page text also asks for the filtered description
+        """
+        if not page_content:
+            return "", _JOB_FIELDS
+        
+        # Limit content size for LLM processing
+        default_max_tokens = BODY_TEXT_MAX_TOKENS if raw_page else JOB_CONTENT_MAX_TOKENS
+        max_tokens = default_max_tokens if max_tokens is None else min(max_tokens, default_max_tokens)
+        content_preview, truncated = _truncate_to_tokens(page_content, max_tokens)
+        if truncated:
+            content_preview += "..."
+        if raw_page:
+            return f"\nPAGE TEXT (unfiltered):\n{content_preview}", f"{_JOB_FIELDS}\n{_JOB_DESCRIPTION_FIELD}"
+        return f"\nPAGE CONTENT:\n{content_preview}", _JOB_FIELDS
+    
+    def _job_extraction_prompts(self, url, page_title, page_content=None, raw_page=False):
+        """
+        Build the (user_prompt, system_prompt, similarity_text) request for job information extraction.
+        
+        raw_page: page_content is the page's unfiltered body text; the job description is
+        then filtered out of it in the same call and returned as the "description" field
+        """
+        system_prompt = JOB_SYSTEM_PROMPT
+        
+        content_section, job_fields = self._job_content_section(page_content, raw_page)
         
         user_prompt = f"""Please analyze this job posting information and extract details as JSON:
 
@@ -623,93 +1294,263 @@ URL: {url}
 PAGE TITLE: {page_title}{content_section}
 
 Return a JSON object with these fields:
-- "job_title": The specific job title/position name
-- "company": Company name
-- "location": Job location (city, state, remote, etc.)
-- "employment_type": Full-time, Part-time, Contract, etc.
-- "experience_level": Entry, Mid, Senior, Executive, etc.
-- "department": Engineering, Marketing, Sales, etc.
-- "salary_range": If mentioned (or "Not specified")
-- "remote_options": Remote, Hybrid, On-site, or "Not specified"
-- "key_requirements": Array of 3-5 main requirements/qualifications
-- "key_responsibilities": Array of 3-5 main job responsibilities
-- "required_skills": Array of technical/professional skills mentioned
-- "company_description": Brief description of the company (if available)
+{job_fields}
 
 Extract information from the URL pattern, page title, and content. Be intelligent about parsing different URL structures and job board formats."""
         
-        result, success = self._call_llm(user_prompt, system_prompt, tier=2)
-        
-        if success and result:
-            print(f"   ✅ LLM extracted job info: {result.get('job_title', 'Unknown')} at {result.get('company', 'Unknown')}")
+        similarity_text = f"{url}\n{page_title}\n{(page_content or '')[:1000]}"
+        return user_prompt, system_prompt, similarity_text
+    
+    def _job_info_from_result(self, result, success):
+        """Validate an LLM job extraction result."""
+        if success and _has_expected_fields(result, JOB_SYSTEM_PROMPT):
+            logger.info(f"   ✅ LLM extracted job info: {result.get('job_title', 'Unknown')} at {result.get('company', 'Unknown')}")
             return result
         else:
             raise Exception("❌ LLM job extraction failed. Please check your LLM connection and model availability.")
     
+    def _fused_page_budget(self, resume_text, url, page_title, raw_page=False):
+        """
+        Tokens of page text a fused resume + job prompt can carry, or None when unbounded.
+        
+        A local model's context (OLLAMA_NUM_CTX) holds both the prompt and the reply, and
+        Ollama drops the start of a prompt that doesn't fit - which is the resume - so the
+        page text only gets what the resume, the instructions and the reply budget leave.
+        """
+        if 'base_url' not in self._tier[2]:
+            return None
+        job_fields = f"{_JOB_FIELDS}\n{_JOB_DESCRIPTION_FIELD}" if raw_page else _JOB_FIELDS
+        scaffold = self._combined_user_prompt(resume_text, url, page_title, "", job_fields)
+        used = _count_tokens(COMBINED_SYSTEM_PROMPT) + _count_tokens(scaffold) + self.num_predict_long
+        # The token count only approximates the model's own tokenizer - keep 10% headroom
+        return int(self.num_ctx * 0.9) - used
+    
+    def _combined_extraction_prompts(self, resume_text, url, page_title, page_content=None, raw_page=False, page_budget=None):
+        """
+        Build one (user_prompt, system_prompt, similarity_text) request extracting resume and job together.
+        page_budget: page text token limit from _fused_page_budget (None keeps the default)
+        """
+        content_section, job_fields = self._job_content_section(page_content, raw_page, page_budget)
+        user_prompt = self._combined_user_prompt(resume_text, url, page_title, content_section, job_fields)
+        similarity_text = f"{resume_text}\n{url}\n{page_title}\n{(page_content or '')[:1000]}"
+        return user_prompt, COMBINED_SYSTEM_PROMPT, similarity_text
+    
+    def _combined_user_prompt(self, resume_text, url, page_title, content_section, job_fields):
+        """The fused resume + job extraction prompt; the resume goes first."""
+        return f"""Please analyze this resume and this job posting and extract details from both as JSON:
+
+RESUME TEXT:
+{_resume_prompt_text(resume_text)}
+
+JOB POSTING:
+URL: {url}
+PAGE TITLE: {page_title}{content_section}
+
+Return a JSON object with exactly two keys, "resume" and "job".
+
+"resume" is an object with these fields:
+{_RESUME_FIELDS}
+
+"job" is an object with these fields:
+{job_fields}
+
+If information is not clearly available, use "Not specified" for text fields, 0 for years_experience, and empty arrays for lists."""
+    
+    def _combined_info_from_result(self, resume_text, result, success):
+        """Split a combined extraction result into (resume_info, job_info)."""
+        resume_result = result.get('resume') if success and isinstance(result, dict) else None
+        job_result = result.get('job') if success and isinstance(result, dict) else None
+        resume_info = self._resume_info_from_result(resume_text, resume_result, bool(resume_result))
+        job_info = self._job_info_from_result(job_result, bool(job_result))
+        return resume_info, job_info
+    
     def _fallback_job_extraction(self, url, page_title):
         """This method is removed - LLM-only approach."""
         raise Exception("❌ Job extraction requires LLM. Fallback methods have been removed.")
 
-    def _create_intelligent_folder_name(self, job_data):
-        """Create an intelligent folder name using LLM insights."""
-        company = job_data.get('company', 'Unknown_Company')
-        job_title = job_data.get('job_title', 'Position')
-        
-        # Handle list/array data types
-        if isinstance(company, list):
-            company = company[0] if company else 'Unknown_Company'
-        elif not isinstance(company, str):
-            company = str(company) if company else 'Unknown_Company'
-            
-        if isinstance(job_title, list):
-            job_title = job_title[0] if job_title else 'Position'
-        elif not isinstance(job_title, str):
-            job_title = str(job_title) if job_title else 'Position'
+    def _create_intelligent_folder_name(self, job_data, clean_company=None, now=None):
+        """
+        Create an intelligent folder name using LLM insights.
         
+        clean_company: an already filename-cleaned company name to reuse
+        now: a time.struct_time to timestamp with (defaults to the current local time)
+        """
         # Clean company name for folder
-        clean_company = re.sub(r'[^\w\s-]', '', company).strip()
-        clean_company = re.sub(r'[-\s]+', '_', clean_company)
+        if clean_company is None:
+            clean_company = _clean_filename_part(_field_text(job_data.get('company'), 'Unknown_Company'))
         
         # Clean job title for folder  
-        clean_title = re.sub(r'[^\w\s-]', '', job_title).strip()
-        clean_title = re.sub(r'[-\s]+', '_', clean_title)
+        clean_title = _clean_filename_part(_field_text(job_data.get('job_title'), 'Position'))
         
         # Limit length
         if len(clean_title) > 25:
             clean_title = clean_title[:25]
         
-        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime('%Y%m%d_%H%M%S', now or time.localtime())
         
         return f"{clean_company}_{clean_title}_{timestamp}"
 
+@functools.lru_cache(maxsize=1)
+def _get_processor():
+    """Shared LLMJobProcessor so provider clients, the HTTP session and caches are set up once per run."""
+    return LLMJobProcessor()
+
+@functools.lru_cache(maxsize=1)
+def _get_pdf_pool(max_workers):
+    """
+    Shared process pool for PDF rendering in batch runs.
+    
+    Workers are spawned rather than forked - the parent already runs logging
+    and asyncio worker threads, which a forked child would inherit mid-lock.
+    Before Python 3.11 all max_workers processes start on the first submit.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_pdf_worker,
+        initargs=(logging.getLogger().getEffectiveLevel(),)
+    )
+
+def _init_pdf_worker(level):
+    """Log from PDF worker processes at the parent's level."""
+    logging.basicConfig(stream=sys.stderr, format='%(message)s', level=level)
+
+def _submit_pdf_render(cover_letter, output_filename):
+    """Start the PDF render in the batch pool; None when it should render in-process."""
+    if not _pdf_pool_workers:
+        return None
+    try:
+        return _get_pdf_pool(_pdf_pool_workers).submit(
+            LLMJobProcessor._generate_cover_letter_pdf_cached, cover_letter, output_filename
+        )
+    except BrokenProcessPool:
+        _get_pdf_pool.cache_clear()
+        return None
+
+def _finish_pdf_render(pdf_future, cover_letter, output_filename):
+    """Wait for a pooled PDF render, falling back to rendering in-process."""
+    if pdf_future is not None:
+        try:
+            return pdf_future.result()
+        except BrokenProcessPool:
+            # A dead worker breaks the whole pool - drop it so the next letter gets a fresh one
+            logger.warning("   ⚠️ PDF worker pool broke - rendering in-process")
+            _get_pdf_pool.cache_clear()
+    return LLMJobProcessor._generate_cover_letter_pdf_cached(cover_letter, output_filename)
+
 def parse_resume(resume_path):
     """Parse the resume and extract key information using LLM."""
     try:
-        with open(resume_path, 'r', encoding='utf-8') as f:
-            resume_text = f.read()
+        processor = _get_processor()
         
-        processor = LLMJobProcessor()
-        return processor._llm_extract_resume_info(resume_text)
+        # A resume rarely changes between applications - skip the LLM when its
+        # content hasn't (the cache is keyed by a hash of the file's bytes)
+        resume_bytes = _read_resume_bytes(resume_path)
+        resume_info = processor._get_cached_resume_info(resume_bytes)
+        if resume_info:
+            logger.info(f"   ♻️ Using cached resume info for: {resume_info['name']}")
+            return resume_info
+        
+        resume_text = resume_bytes.decode('utf-8')
+        
+        resume_info = processor._llm_extract_resume_info(resume_text)
+        processor._cache_resume_info(resume_bytes, resume_info)
+        return resume_info
         
     except Exception as e:
-        print(f"❌ Error parsing resume: {e}")
+        logger.error(f"❌ Error parsing resume: {e}")
         raise e
 
 def extract_job_info_from_url_and_title(url, title, page_content=None):
     """Extract job information using LLM intelligence."""
-    processor = LLMJobProcessor()
+    processor = _get_processor()
     return processor._llm_extract_job_info(url, title, page_content)
 
+_MISSING_DESCRIPTION_NOTE = """Note: Full job description could not be automatically extracted.
+Please visit the URL above to get the complete job posting details.
+
+To get the full job description:
+1. Visit the application URL above
+2. Close any chat overlays (look for X button)
+3. Copy the complete job description
+4. Paste it here to complete your application package"""
+
+@dataclasses.dataclass(frozen=True)
+class JobData:
+    """Typed view of the job fields written to the job details report."""
+    job_title: str = 'Unknown'
+    company: str = 'Unknown'
+    location: str = 'Unknown'
+    employment_type: str = 'Not specified'
+    experience_level: str = 'Not specified'
+    department: str = 'Not specified'
+    salary_range: str = 'Not specified'
+    remote_options: str = 'Not specified'
+    application_url: str = 'Unknown'
+    page_title: str = 'Unknown'
+    key_requirements: tuple = ()
+    required_skills: tuple = ()
+    key_responsibilities: tuple = ()
+    company_description: str = ''
+    description: str = ''
+    description_is_summary: bool = False
+    
+    @classmethod
+    def from_dict(cls, job_data):
+        """Build from an extracted job dict, ignoring unknown keys and leaving missing/None fields at their defaults."""
+        return cls(**{
+            field.name: job_data[field.name]
+            for field in dataclasses.fields(cls)
+            if job_data.get(field.name) is not None
+        })
+    
+    def to_report_text(self, now=None):
+        """Render the job application details report, stamped with now (a time.struct_time) or the current time."""
+        def bullets(heading, items):
+            return f"\n{heading}\n" + ''.join(f"• {item}\n" for item in items) if items else ""
+        
+        responsibilities = "\n" + ''.join(f"• {resp}\n" for resp in self.key_responsibilities) if self.key_responsibilities else ""
+        company_info = f"\n=== COMPANY INFORMATION ===\n{self.company_description}" if self.company_description else ""
+        description_heading = "JOB DESCRIPTION SUMMARY (condensed from the page text)" if self.description_is_summary else "FULL JOB DESCRIPTION"
+        
+        return f"""=== JOB APPLICATION DETAILS ===
+Generated on: {time.strftime('%B %d, %Y at %I:%M %p', now or time.localtime())}
+
+=== BASIC INFORMATION ===
+Job Title: {self.job_title}
+Company: {self.company}
+Location: {self.location}
+Employment Type: {self.employment_type}
+Experience Level: {self.experience_level}
+Department: {self.department}
+Salary Range: {self.salary_range}
+Remote Options: {self.remote_options}
+
+=== APPLICATION DETAILS ===
+Application URL: {self.application_url}
+Page Title: {self.page_title}
+
+=== JOB REQUIREMENTS ==={bullets("Key Requirements:", self.key_requirements)}{bullets("Required Skills:", self.required_skills)}
+=== JOB RESPONSIBILITIES ==={responsibilities}{company_info}
+
+=== {description_heading} ===
+
+{self.description or _MISSING_DESCRIPTION_NOTE}"""
+
 def save_cover_letter_to_file(cover_letter, company_name, job_data, resume_info=None):
     """Save the cover letter to a file with intelligent organization."""
     try:
-        processor = LLMJobProcessor()
-        folder_name = processor._create_intelligent_folder_name(job_data)
+        processor = _get_processor()
+        
+        # Clean company name once - it's shared by the folder and every filename
+        clean_company = _clean_filename_part(_field_text(company_name, 'Unknown'))
+        # One timestamp for the folder name and the job details header
+        now = time.localtime()
+        folder_name = processor._create_intelligent_folder_name(job_data, clean_company, now)
         
-        # Create the folder if it doesn't exist
-        if not os.path.exists(folder_name):
-            os.makedirs(folder_name)
-            print(f"   📁 Created folder: {folder_name}")
+        # Create the folder if it doesn't exist (single race-free syscall)
+        os.makedirs(folder_name, exist_ok=True)
+        logger.info(f"   📁 Using folder: {folder_name}")
         
         # Get applicant name from resume_info first, then fallback methods
         applicant_name = "Unknown"
@@ -718,131 +1559,51 @@ def save_cover_letter_to_file(cover_letter, company_name, job_data, resume_info=
         if resume_info and resume_info.get('name'):
             applicant_name = resume_info['name']
         else:
-            # Fallback: try to get name from cover letter
-            try:
-                lines = cover_letter.split('\n')
-                for line in lines[:10]:
-                    line = line.strip()
-                    if line and len(line.split()) >= 2 and len(line) < 50:
-                        if not any(word in line.lower() for word in ['dear', 'hiring', 'manager', 'sincerely', 'regards', 'best', 'quick', 'hits']):
-                            # Found a potential name, clean it up
-                            potential_name = line.replace(',', '').strip()
-                            if len(potential_name.split()) >= 2:  # At least first and last name
-                                name_parts = potential_name.split()
-                                if len(name_parts) >= 2:
-                                    first_name = name_parts[0]
-                                    last_name = name_parts[-1]  # Take the last word as last name
-                                    applicant_name = f"{first_name}_{last_name}"
-                                    break
-            except:
-                pass
+            # Fallback: try to get name from the first 10 lines of the cover letter
+            name_match = _NAME_LINE_RE.search('\n'.join(cover_letter.split('\n', 10)[:10]))
+            if name_match:
+                first_name = name_match.group('first').replace(',', '')
+                last_name = name_match.group('last').replace(',', '')  # Take the last word as last name
+                applicant_name = f"{first_name}_{last_name}"
         
         # If we still couldn't extract a name, use default
         if applicant_name == "Unknown":
             applicant_name = "David_Tijerina"  # Default based on your resume
         
         # Clean applicant name for filename (remove invalid characters)
-        applicant_name = re.sub(r'[^\w\s-]', '', applicant_name).strip()
-        applicant_name = re.sub(r'[-\s]+', '_', applicant_name)
-        
-        # Clean company name for filename
-        company_for_filename = company_name
-        if isinstance(company_name, list):
-            company_for_filename = company_name[0] if company_name else "Unknown"
-        elif not isinstance(company_name, str):
-            company_for_filename = str(company_name) if company_name else "Unknown"
-        
-        clean_company = re.sub(r'[^\w\s-]', '', company_for_filename).strip()
-        clean_company = re.sub(r'[-\s]+', '_', clean_company)
+        applicant_name = _clean_filename_part(applicant_name)
         
         # Save cover letter in both formats with new naming convention
         base_filename = f"{applicant_name}_{clean_company}_coverletter"
         
-        # Save as text file first
-        cover_letter_filename_txt = os.path.join(folder_name, f"{base_filename}.txt")
-        with open(cover_letter_filename_txt, 'w', encoding='utf-8') as f:
-            f.write(cover_letter)
-        print(f"   ✅ Cover letter saved as text: {cover_letter_filename_txt}")
-        
-        # Save as PDF
+        # Batch runs render the PDF in the worker pool while the text files are written
         cover_letter_filename_pdf = os.path.join(folder_name, f"{base_filename}.pdf")
-        if processor._generate_cover_letter_pdf(cover_letter, cover_letter_filename_pdf):
-            print(f"   ✅ Cover letter saved as PDF: {cover_letter_filename_pdf}")
-        else:
-            print(f"   ⚠️ PDF generation failed, but text version is available")
+        pdf_future = _submit_pdf_render(cover_letter, cover_letter_filename_pdf)
+        
+        # Save as text file
+        cover_letter_filename_txt = os.path.join(folder_name, f"{base_filename}.txt")
+        _write_text(cover_letter_filename_txt, cover_letter)
+        logger.info(f"   ✅ Cover letter saved as text: {cover_letter_filename_txt}")
         
         # Save comprehensive job information
-        job_description_content = f"""=== JOB APPLICATION DETAILS ===
-Generated on: {time.strftime('%B %d, %Y at %I:%M %p')}
-
-=== BASIC INFORMATION ===
-Job Title: {job_data.get('job_title', 'Unknown')}
-Company: {job_data.get('company', 'Unknown')}
-Location: {job_data.get('location', 'Unknown')}
-Employment Type: {job_data.get('employment_type', 'Not specified')}
-Experience Level: {job_data.get('experience_level', 'Not specified')}
-Department: {job_data.get('department', 'Not specified')}
-Salary Range: {job_data.get('salary_range', 'Not specified')}
-Remote Options: {job_data.get('remote_options', 'Not specified')}
-
-=== APPLICATION DETAILS ===
-Application URL: {job_data.get('application_url', 'Unknown')}
-Page Title: {job_data.get('page_title', 'Unknown')}
-
-=== JOB REQUIREMENTS ==="""
-
-        if job_data.get('key_requirements'):
-            job_description_content += "\nKey Requirements:\n"
-            for req in job_data.get('key_requirements', []):
-                job_description_content += f"• {req}\n"
+        job_desc_filename = os.path.join(folder_name, f"{clean_company}_JobDetails.txt")
+        _write_text(job_desc_filename, JobData.from_dict(job_data).to_report_text(now))
+        logger.info(f"   ✅ Job details saved: {job_desc_filename}")
         
-        if job_data.get('required_skills'):
-            job_description_content += "\nRequired Skills:\n"
-            for skill in job_data.get('required_skills', []):
-                job_description_content += f"• {skill}\n"
-
-        job_description_content += "\n=== JOB RESPONSIBILITIES ==="
-        if job_data.get('key_responsibilities'):
-            job_description_content += "\n"
-            for resp in job_data.get('key_responsibilities', []):
-                job_description_content += f"• {resp}\n"
-
-        if job_data.get('company_description'):
-            job_description_content += f"\n=== COMPANY INFORMATION ===\n{job_data.get('company_description')}"
-
-        if job_data.get('description'):
-            job_description_content += f"\n\n=== FULL JOB DESCRIPTION ===\n\n{job_data.get('description')}"
+        if _finish_pdf_render(pdf_future, cover_letter, cover_letter_filename_pdf):
+            logger.info(f"   ✅ Cover letter saved as PDF: {cover_letter_filename_pdf}")
         else:
-            job_description_content += f"""
-
-=== FULL JOB DESCRIPTION ===
-
-Note: Full job description could not be automatically extracted.
-Please visit the URL above to get the complete job posting details.
-
-To get the full job description:
-1. Visit the application URL above
-2. Close any chat overlays (look for X button)
-3. Copy the complete job description
-4. Paste it here to complete your application package"""
-        
-        job_desc_filename = os.path.join(folder_name, f"{clean_company}_JobDetails.txt")
-        with open(job_desc_filename, 'w', encoding='utf-8') as f:
-            f.write(job_description_content)
-        print(f"   ✅ Job details saved: {job_desc_filename}")
+            logger.warning(f"   ⚠️ PDF generation failed, but text version is available")
         
         return folder_name
         
     except Exception as e:
-        print(f"   ❌ Error saving files: {e}")
+        logger.error(f"   ❌ Error saving files: {e}")
         return None
 
 def generate_cover_letter(job_info, resume_info, cover_letter_instructions_path=None):
     """Generate a fully dynamic and personalized cover letter using LLM."""
     try:
-        # Import the LLM cover letter generator
-        from llm_cover_letter import generate_llm_cover_letter
-        
         # Get the full resume text
         resume_text = resume_info.get('full_content', '')
         if not resume_text:
@@ -851,7 +1612,7 @@ def generate_cover_letter(job_info, resume_info, cover_letter_instructions_path=
         # Get instructions path from environment or parameter
         instructions_path = cover_letter_instructions_path or os.getenv('COVER_LETTER_INSTRUCTIONS_PATH', '')
         
-        print("   🤖 Generating cover letter using LLM...")
+        logger.info("   🤖 Generating cover letter using LLM...")
         
         # Generate cover letter using LLM
         cover_letter, success = generate_llm_cover_letter(
@@ -861,7 +1622,7 @@ def generate_cover_letter(job_info, resume_info, cover_letter_instructions_path=
         )
         
         if success:
-            print("   ✅ LLM cover letter generation successful")
+            logger.info("   ✅ LLM cover letter generation successful")
             # Save cover letter to organized folder
             folder_name = save_cover_letter_to_file(cover_letter, job_info.get('company', 'Unknown'), job_info, resume_info)
             return cover_letter, folder_name
@@ -871,138 +1632,269 @@ def generate_cover_letter(job_info, resume_info, cover_letter_instructions_path=
     except ImportError:
         raise Exception("❌ LLM cover letter module not available. Please ensure llm_cover_letter.py is present.")
     except Exception as e:
-        print(f"   ❌ Error generating LLM cover letter: {e}")
+        logger.error(f"   ❌ Error generating LLM cover letter: {e}")
         raise e
 
 def generate_fallback_cover_letter(job_info, resume_info):
     """This function is removed - LLM-only approach."""
     raise Exception("❌ Cover letter generation requires LLM. Fallback methods have been removed.")
 
-async def enhanced_job_processor(url, resume_path):
-    """Enhanced job application processor using LLM intelligence throughout."""
+async def _launch_browser(playwright):
+    """Launch Chromium using the browser settings from the environment."""
+    headless = os.getenv('BROWSER_HEADLESS', 'false').lower() == 'true'
+    return await playwright.chromium.launch(headless=headless)
+
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media', 'stylesheet'}
+
+async def _block_heavy_resources(route):
+    """Abort requests for resources that don't contribute page text."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _scrape_job_page(browser, url):
+    """
+    Load a job posting in a fresh browser context and extract its description.
+    
+    Returns:
+        tuple: (page_title, job_description, raw_body) - when no description element
+        is found, raw_body holds the page's unfiltered text (else None)
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    
+    job_description = None
+    raw_body = None
+    page_title = "Job Application"
+    timeout = int(os.getenv('BROWSER_TIMEOUT', '30000'))
     
-    print("🚀 ENHANCED LLM-POWERED JOB APPLICATION PROCESSOR")
-    print("="*65)
-    print("Using AI intelligence for all extraction and generation tasks")
-    print("="*65)
+    # Each URL gets its own isolated context so one browser can serve many jobs
+    context = await browser.new_context(viewport={'width': 1280, 'height': 800})
+    # Only the text matters - skip images, fonts, media and CSS so the page
+    # settles quickly and pulls far fewer bytes
+    await context.route('**/*', _block_heavy_resources)
+    page = await context.new_page()
+    title_task = None
     
     try:
-        from playwright.async_api import async_playwright
+        await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
+        # The title is already known at DOMContentLoaded - fetch it while the page settles
+        title_task = asyncio.ensure_future(page.title())
         
-        # Step 1: Parse resume using LLM
-        print("📄 Step 1: Parsing resume with LLM intelligence...")
-        resume_info = parse_resume(resume_path)
-        print(f"   ✅ Parsed resume for: {resume_info['name']} ({resume_info['email']})")
-        if resume_info.get('key_skills'):
-            print(f"   🎯 Key skills identified: {', '.join(resume_info['key_skills'][:5])}")
+        # Enhanced job description extraction
+        logger.info("   🔍 Attempting enhanced content extraction...")
         
-        # Step 2: Enhanced web scraping and extraction
-        print("🌐 Step 2: Getting job page information with enhanced extraction...")
+        # Wait for content to load - proceed as soon as the page is ready, but
+        # never longer than the fixed 3 seconds this used to sleep
+        settle_deadline = time.monotonic() + 3
+        try:
+            await page.wait_for_selector('main, article, [class*=job], [data-testid*=job]', timeout=1500)
+        except PlaywrightTimeoutError:
+            pass  # Not every board uses these containers
+        # Late XHR-loaded content gets the rest of the budget; pages that poll never go idle
+        remaining_ms = int((settle_deadline - time.monotonic()) * 1000)
+        if remaining_ms > 0:
+            try:
+                await page.wait_for_load_state('networkidle', timeout=remaining_ms)
+            except PlaywrightTimeoutError:
+                pass  # Probe selectors anyway
         
-        job_description = None
-        page_title = "Job Application"
+        page_title = await title_task
+        logger.info(f"   📋 Page title: {page_title}")
         
-        async with async_playwright() as p:
-            # Get browser settings from environment
-            headless = os.getenv('BROWSER_HEADLESS', 'false').lower() == 'true'
-            timeout = int(os.getenv('BROWSER_TIMEOUT', '30000'))
-            
-            browser = await p.chromium.launch(headless=headless)
-            page = await browser.new_page()
-            
+        # Try comprehensive content extraction - all selectors are probed inside
+        # the page in a single round-trip instead of one CDP call per selector
+        match = await page.evaluate(_FIRST_SUBSTANTIAL_TEXT_JS, JOB_DESCRIPTION_SELECTORS)
+        if match:
+            job_description = match['text']
+            logger.info(f"   ✅ Found job description using: {match['selector']}")
+        
+        # Fallback: hand the whole body text to the job extraction call, which
+        # filters out the description and extracts the job details in one go
+        if not job_description:
             try:
-                await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
-                page_title = await page.title()
-                print(f"   📋 Page title: {page_title}")
-                
-                # Enhanced job description extraction
-                print("   🔍 Attempting enhanced content extraction...")
-                
-                # Wait for content to load
-                await page.wait_for_timeout(3000)
-                
-                # Try comprehensive content extraction
-                extraction_strategies = [
-                    # Specific job description selectors
-                    '[data-testid="job-description"]',
-                    '.job-description',
-                    '[id*="job-description"]',
-                    '[class*="job-description"]',
-                    '[data-testid="jobDescription"]',
-                    
-                    # Content area selectors
-                    '.content',
-                    '[data-testid="content"]',
-                    'main',
-                    '.application-content',
-                    '#content',
-                    '.job-details',
-                    '.position-details',
-                    
-                    # Greenhouse specific
-                    '.application-question',
-                    '.job-post',
-                    '#main-content',
-                    
-                    # Generic content areas
-                    'article',
-                    '.job-posting',
-                    '.posting-requirements'
-                ]
-                
-                for selector in extraction_strategies:
-                    try:
-                        element = await page.query_selector(selector)
-                        if element:
-                            text = await element.inner_text()
-                            if text and len(text.strip()) > 150:  # Substantial content
-                                job_description = text.strip()
-                                print(f"   ✅ Found job description using: {selector}")
-                                break
-                    except:
-                        continue
-                
-                # Enhanced fallback: intelligent body text filtering
-                if not job_description:
-                    try:
-                        body_text = await page.evaluate('() => document.body.innerText')
-                        if body_text and len(body_text.strip()) > 300:
-                            # Use LLM to extract relevant job content from page
-                            processor = LLMJobProcessor()
-                            system_prompt = "Extract job description content from webpage text. Return only the relevant job posting content, filtering out navigation, ads, and footer content."
-                            
-                            user_prompt = f"Extract the job description and requirements from this webpage text:\n\n{body_text[:3000]}"
-                            
-                            result, success = processor._call_llm(user_prompt, system_prompt)
-                            if success and result.get('content'):
-                                job_description = result['content']
-                                print(f"   ✅ LLM extracted job content from page body")
-                            else:
-                                print(f"   ⚠️ LLM content extraction failed - no job description available")
-                    except Exception as e:
-                        print(f"   ⚠️ Body text extraction failed: {e}")
-                
+                body_text = await page.evaluate(_BODY_TEXT_WITHOUT_BOILERPLATE_JS)
+                if body_text and len(body_text.strip()) > 300:
+                    raw_body = body_text
+                    logger.info(f"   📄 No description element found - job details will be extracted from the page body")
             except Exception as e:
-                print(f"   ⚠️ Could not load page: {e}")
-            
-            await browser.close()
+                logger.warning(f"   ⚠️ Body text extraction failed: {e}")
+        
+    except Exception as e:
+        logger.warning(f"   ⚠️ Could not load page: {e}")
+    finally:
+        if title_task is not None:
+            # Still pending when the settle wait failed - settle it before the page closes
+            title_task.cancel()
+            await asyncio.gather(title_task, return_exceptions=True)
+        await context.close()
+    
+    return page_title, job_description, raw_body
+
+async def _scrape_and_extract_job(url, browser, processor, resume_task, resume_bytes=None):
+    """
+    Steps 1-2: scrape the job page and extract job details with the LLM.
+    
+    resume_task is awaited alongside the job extraction; when it is None the
+    resume (resume_bytes) is extracted in the same LLM call as the job.
+    
+    Returns:
+        tuple: (page_title, job_description, resume_info, job_info)
+    """
+    from playwright.async_api import async_playwright
+    
+    fused = resume_task is None
+    
+    # Step 1: Enhanced web scraping and extraction
+    logger.info("🌐 Step 1: Getting job page information with enhanced extraction...")
+    
+    if browser is not None:
+        page_title, job_description, raw_body = await _scrape_job_page(browser, url)
+    else:
+        async with async_playwright() as p:
+            browser = await _launch_browser(p)
+            try:
+                page_title, job_description, raw_body = await _scrape_job_page(browser, url)
+            finally:
+                await browser.close()
+    
+    # Step 2: Job extraction runs while the background resume parse finishes
+    logger.info("🎯 Step 2: Extracting job information with LLM intelligence...")
+    # Without a description element the unfiltered body text goes to the same
+    # call, which also returns the filtered description
+    raw_page = job_description is None and raw_body is not None
+    page_content = raw_body if raw_page else job_description
+    if fused:
+        resume_text = resume_bytes.decode('utf-8')
+        page_budget = processor._fused_page_budget(resume_text, url, page_title, raw_page)
+        if page_budget is not None and page_budget < _MIN_FUSED_PAGE_TOKENS:
+            # The resume would crowd the posting (or itself) out of the model's context
+            logger.info("   📄 Resume and job posting don't fit one context window - extracting them separately")
+            fused = False
+            resume_task = asyncio.create_task(processor._parse_resume_bytes_async(resume_bytes))
+    if fused:
+        user_prompt, system_prompt, similarity_text = processor._combined_extraction_prompts(
+            resume_text, url, page_title, page_content, raw_page, page_budget
+        )
+        result, success = await processor._call_llm_async(
+            user_prompt, system_prompt, 2, similarity_text, processor.num_predict_long
+        )
+        resume_info, job_info = processor._combined_info_from_result(resume_text, result, success)
+        await asyncio.to_thread(processor._cache_resume_info, resume_bytes, resume_info)
+        await asyncio.to_thread(processor._cache_job_info, url, page_content, job_info)
+    else:
+        try:
+            # A posting already extracted with identical page content skips the LLM
+            job_info = await asyncio.to_thread(processor._get_cached_job_info, url, page_content)
+            if job_info:
+                resume_info = await resume_task
+            else:
+                user_prompt, system_prompt, similarity_text = processor._job_extraction_prompts(
+                    url, page_title, page_content, raw_page
+                )
+                resume_info, (job_result, job_success) = await asyncio.gather(
+                    resume_task,
+                    processor._call_llm_async(
+                        user_prompt, system_prompt, 2, similarity_text,
+                        processor.num_predict_long if raw_page else None
+                    )
+                )
+                job_info = processor._job_info_from_result(job_result, job_success)
+                await asyncio.to_thread(processor._cache_job_info, url, page_content, job_info)
+        except BaseException:
+            # gather doesn't cancel the resume parse when the job call fails
+            resume_task.cancel()
+            await asyncio.gather(resume_task, return_exceptions=True)
+            raise
+    
+    if raw_page:
+        job_description = job_info.get('description') or None
+        if job_description:
+            # Only a condensed version fits the reply - label it wherever it's shown
+            job_info['description_is_summary'] = True
+            logger.info(f"   ✅ LLM extracted job content from page body")
+        else:
+            logger.warning(f"   ⚠️ LLM content extraction failed - no job description available")
+    
+    return page_title, job_description, resume_info, job_info
+
+async def enhanced_job_processor(url, resume_path, browser=None, processor=None, resume_info=None):
+    """
+    Enhanced job application processor using LLM intelligence throughout.
+    
+    browser, processor and resume_info may be supplied by a batch driver
+    (see process_many) so they are shared across URLs instead of recreated.
+    """
+    
+    logger.info("🚀 ENHANCED LLM-POWERED JOB APPLICATION PROCESSOR")
+    logger.info("="*65)
+    logger.info("Using AI intelligence for all extraction and generation tasks")
+    logger.info("="*65)
+    
+    try:
+        processor = processor or _get_processor()
+        
+        # A URL processed within JOB_PAGE_CACHE_TTL skips the browser and job extraction
+        cached_page = await asyncio.to_thread(processor._get_cached_job_page, url)
+        
+        # With fused extraction an uncached resume is parsed in the same LLM
+        # call as the job in Step 2
+        fused = False
+        resume_bytes = None
+        if resume_info is None and FUSED_EXTRACTION and not cached_page:
+            resume_bytes = await asyncio.to_thread(_read_resume_bytes, resume_path)
+            resume_info = processor._get_cached_resume_info(resume_bytes)
+            if resume_info:
+                logger.info(f"   ♻️ Using cached resume info for: {resume_info['name']}")
+            fused = resume_info is None
+        
+        # Resume parsing doesn't depend on the job page - start it now so the LLM
+        # call overlaps browser launch and page navigation
+        if fused:
+            logger.info("📄 Resume will be parsed together with the job posting...")
+            resume_task = None
+        elif resume_info is None:
+            logger.info("📄 Parsing resume with LLM intelligence in the background...")
+            resume_task = asyncio.create_task(processor._parse_resume_async(resume_path))
+        else:
+            resume_task = asyncio.create_task(asyncio.sleep(0, result=resume_info))
         
-        # Step 3: LLM-powered job information extraction
-        print("🎯 Step 3: Extracting job information with LLM intelligence...")
-        job_info = extract_job_info_from_url_and_title(url, page_title, job_description)
+        if cached_page:
+            logger.info("🌐 Steps 1-2: ♻️ Using cached job page and job details (no browser launch)")
+            page_title = cached_page['page_title']
+            job_description = cached_page['description']
+            job_info = cached_page['job_info']
+            resume_info = await resume_task
+        else:
+            try:
+                page_title, job_description, resume_info, job_info = await _scrape_and_extract_job(
+                    url, browser, processor, resume_task, resume_bytes if fused else None
+                )
+            except BaseException:
+                if resume_task is not None:
+                    # Scraping failed before the resume parse was awaited - don't leave it running
+                    resume_task.cancel()
+                    await asyncio.gather(resume_task, return_exceptions=True)
+                raise
+            if job_description:
+                await asyncio.to_thread(processor._cache_job_page, url, page_title, job_description, job_info)
+        
+        logger.info(f"   ✅ Parsed resume for: {resume_info['name']} ({resume_info['email']})")
+        if resume_info.get('key_skills'):
+            logger.info(f"   🎯 Key skills identified: {', '.join(resume_info['key_skills'][:5])}")
         
-        print(f"   📊 Extracted comprehensive job details:")
-        print(f"      Title: {job_info.get('job_title', 'Unknown')}")
-        print(f"      Company: {job_info.get('company', 'Unknown')}")
-        print(f"      Location: {job_info.get('location', 'Unknown')}")
-        print(f"      Type: {job_info.get('employment_type', 'Not specified')}")
-        print(f"      Level: {job_info.get('experience_level', 'Not specified')}")
-        print(f"      Remote: {job_info.get('remote_options', 'Not specified')}")
+        logger.info(f"   📊 Extracted comprehensive job details:")
+        logger.info(f"      Title: {job_info.get('job_title', 'Unknown')}")
+        logger.info(f"      Company: {job_info.get('company', 'Unknown')}")
+        logger.info(f"      Location: {job_info.get('location', 'Unknown')}")
+        logger.info(f"      Type: {job_info.get('employment_type', 'Not specified')}")
+        logger.info(f"      Level: {job_info.get('experience_level', 'Not specified')}")
+        logger.info(f"      Remote: {job_info.get('remote_options', 'Not specified')}")
         
         if job_info.get('required_skills'):
-            print(f"      Skills: {', '.join(job_info.get('required_skills', [])[:5])}")
+            logger.info(f"      Skills: {', '.join(job_info.get('required_skills', [])[:5])}")
         
-        # Step 4: Prepare comprehensive job data
+        # Step 3: Prepare comprehensive job data
         job_data = {
             **job_info,  # Include all LLM-extracted fields
             'application_url': url,
@@ -1010,79 +1902,132 @@ async def enhanced_job_processor(url, resume_path):
             'description': job_description
         }
         
-        # Step 5: Generate intelligent cover letter
-        print("📝 Step 4: Generating intelligent cover letter...")
-        cover_letter, folder_name = generate_cover_letter(job_data, resume_info)
+        # Step 4: Generate intelligent cover letter
+        logger.info("📝 Step 3: Generating intelligent cover letter...")
+        # Generation and the txt/PDF/job-details writes are blocking - keep them off the event loop
+        cover_letter, folder_name = await asyncio.to_thread(generate_cover_letter, job_data, resume_info)
         
         if folder_name:
-            print(f"\n🎉 SUCCESS! Enhanced application package created!")
-            print(f"   📁 Folder: {folder_name}")
-            print(f"   📄 Files created:")
-            print(f"      • Intelligent cover letter (Text + PDF formats)")
-            print(f"      • Comprehensive job details (LLM-extracted)")
+            logger.info(f"\n🎉 SUCCESS! Enhanced application package created!")
+            logger.info(f"   📁 Folder: {folder_name}")
+            logger.info(f"   📄 Files created:")
+            logger.info(f"      • Intelligent cover letter (Text + PDF formats)")
+            logger.info(f"      • Comprehensive job details (LLM-extracted)")
             
             if job_description:
-                print(f"      • ✅ Job description successfully extracted")
+                logger.info(f"      • ✅ Job description successfully extracted")
             else:
-                print(f"      • ⚠️  Job description placeholder (manual copy needed)")
+                logger.warning(f"      • ⚠️  Job description placeholder (manual copy needed)")
             
-            print(f"\n📖 Cover Letter Preview:")
-            print("-" * 50)
-            lines = cover_letter.split('\n')
+            logger.info(f"\n📖 Cover Letter Preview:")
+            logger.info("-" * 50)
+            lines = cover_letter.splitlines()
             for line in lines[:15]:  # Show first 15 lines
-                print(line)
+                logger.info(line)
             if len(lines) > 15:
-                print("... (complete letter saved to file)")
-            print("-" * 50)
+                logger.info("... (complete letter saved to file)")
+            logger.info("-" * 50)
             
-            print(f"\n💡 Next Steps:")
-            print(f"   1. ✅ Your intelligent cover letter is ready")
-            print(f"   2. ✅ Comprehensive job analysis completed")
+            logger.info(f"\n💡 Next Steps:")
+            logger.info(f"   1. ✅ Your intelligent cover letter is ready")
+            logger.info(f"   2. ✅ Comprehensive job analysis completed")
             if job_description:
-                print(f"   3. ✅ Job requirements automatically extracted")
-                print(f"   4. 🎯 Review the AI-generated content")
-                print(f"   5. 📧 Submit your optimized application!")
+                logger.info(f"   3. ✅ Job requirements automatically extracted")
+                logger.info(f"   4. 🎯 Review the AI-generated content")
+                logger.info(f"   5. 📧 Submit your optimized application!")
             else:
-                print(f"   3. 🌐 Visit the URL to copy any missing job details")
-                print(f"   4. 🎯 Review the AI-generated content")
-                print(f"   5. 📧 Submit your optimized application!")
+                logger.info(f"   3. 🌐 Visit the URL to copy any missing job details")
+                logger.info(f"   4. 🎯 Review the AI-generated content")
+                logger.info(f"   5. 📧 Submit your optimized application!")
             
         else:
-            print("❌ Failed to create enhanced application package")
+            logger.error("❌ Failed to create enhanced application package")
             
     except Exception as e:
-        print(f"❌ Error in enhanced job processing: {e}")
+        logger.error(f"❌ Error in enhanced job processing: {e}")
         import traceback
         traceback.print_exc()
 
+async def process_many(urls, resume_path, concurrency=4):
+    """
+    Process several job URLs in one run.
+    
+    The resume is parsed once and one Chromium instance is shared; each URL gets
+    its own browser context. At most `concurrency` applications are in flight at
+    a time, so total time is roughly ceil(N / concurrency) single runs.
+    """
+    from playwright.async_api import async_playwright
+    
+    global _pdf_pool_workers
+    # Only `concurrency` letters can be rendering at once
+    _pdf_pool_workers = min(PDF_WORKERS, concurrency) if len(urls) > 1 else 0
+    
+    processor = _get_processor()
+    resume_info = await processor._parse_resume_async(resume_path)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def process_one(url):
+        async with semaphore:
+            await enhanced_job_processor(url, resume_path, browser=browser,
+                                         processor=processor, resume_info=resume_info)
+    
+    async with async_playwright() as p:
+        browser = await _launch_browser(p)
+        try:
+            await asyncio.gather(*[process_one(url) for url in urls])
+        finally:
+            await browser.close()
+
 if __name__ == "__main__":
-    import sys
+    # -q/--quiet only reports warnings and errors (useful for batch runs)
+    args = [arg for arg in sys.argv[1:] if arg not in ('-q', '--quiet')]
+    quiet = len(args) < len(sys.argv) - 1
+    log_listener = _configure_logging('WARNING' if quiet else None)
     
     # Get configuration from environment variables
     default_url = os.getenv('DEFAULT_JOB_URL', 'https://example.com/job-posting')
     default_resume_path = os.getenv('RESUME_PATH', 'resume.txt')
     
     # Use command line arguments if provided, otherwise use environment defaults
-    url = sys.argv[1] if len(sys.argv) > 1 else default_url
-    resume_path = sys.argv[2] if len(sys.argv) > 2 else default_resume_path
+    url = args[0] if len(args) > 0 else default_url
+    resume_path = args[1] if len(args) > 1 else default_resume_path
     
     # Validate that required files exist
     if not os.path.exists(resume_path):
-        print(f"❌ Error: Resume file not found at {resume_path}")
-        print("   Please check your RESUME_PATH in the .env file")
+        logger.error(f"❌ Error: Resume file not found at {resume_path}")
+        logger.error("   Please check your RESUME_PATH in the .env file")
+        log_listener.stop()
         sys.exit(1)
     
     # Instructions path is now optional for LLM-based generation
     instructions_path = os.getenv('COVER_LETTER_INSTRUCTIONS_PATH')
     if instructions_path and not os.path.exists(instructions_path):
-        print(f"⚠️  Warning: Cover letter instructions not found at {instructions_path}")
-        print("   Proceeding with LLM-only generation")
+        logger.warning(f"⚠️  Warning: Cover letter instructions not found at {instructions_path}")
+        logger.warning("   Proceeding with LLM-only generation")
+    
+    # A file of URLs (one per line, '#' for comments) processes a whole batch
+    urls = [url]
+    if os.path.isfile(url):
+        with open(url, 'r', encoding='utf-8') as f:
+            urls = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+        if not urls:
+            logger.error(f"❌ Error: No job URLs found in {url}")
+            logger.error("   Add one URL per line ('#' starts a comment)")
+            log_listener.stop()
+            sys.exit(1)
     
-    print(f"🎯 Processing job application with LLM intelligence:")
-    print(f"   URL: {url}")
-    print(f"   Resume: {resume_path}")
+    logger.info(f"🎯 Processing job application with LLM intelligence:")
+    for job_url in urls:
+        logger.info(f"   URL: {job_url}")
+    logger.info(f"   Resume: {resume_path}")
     if instructions_path and os.path.exists(instructions_path):
-        print(f"   Instructions: {instructions_path}")
-    print()
+        logger.info(f"   Instructions: {instructions_path}")
+    logger.info("")
     
-    asyncio.run(enhanced_job_processor(url, resume_path))
+    try:
+        if len(urls) > 1:
+            asyncio.run(process_many(urls, resume_path, int(os.getenv('BATCH_CONCURRENCY', '4'))))
+        else:
+            asyncio.run(enhanced_job_processor(urls[0], resume_path))
+    finally:
+        log_listener.stop()
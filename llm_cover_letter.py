@@ -2,18 +2,360 @@
 """
 LLM-powered cover letter generation using dynamic Tier 1 LLM providers
 """
+import asyncio
+import functools
+import hashlib
+import io
+import itertools
+import logging
 import os
+import random
 import re
+import string
+import tempfile
+import threading
+import time
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Optional: faster JSON for LLM payloads, responses and the response caches
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv(override=True)  # Force override existing environment variables
 
+logger = logging.getLogger(__name__)
+
+# Characters allowed on either side of the '@' in an email address
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
+# Resume fields scanned by _scan_candidate_info
+# A head line containing any of these is contact info or a heading, not the name
+_NAME_REJECT_KEYWORDS = ('phone', 'email', '@', 'linkedin', 'experience')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_LINKEDIN_RE = re.compile(r'(https?://(?:www\.)?linkedin\.com/in/[^\s]+)', re.IGNORECASE)
+_YEARS_RE = re.compile(r'(\d+)[+]?\s*years?', re.IGNORECASE)
+# Tried in order - a leadership title anywhere beats an individual contributor title
+_TITLE_RES = (
+    # The tail stays on the title's own line and stops at a word boundary within
+    # 60 characters so it can't run on through the rest of a paragraph
+    re.compile(r'(?:VP|Vice President|Director|Senior|Lead|Principal|Chief)[ \t]+[A-Za-z](?:[A-Za-z \t]{0,60}\b)?', re.IGNORECASE),
+    re.compile(r'(?:Software|Engineering|Technology|Product)\s+(?:Manager|Director|Lead|Engineer)', re.IGNORECASE),
+)
+
+# Cover letter cleanup in _post_process_cover_letter
+_QUICK_HITS_RE = re.compile(r'[\*\s]*\*\*Quick Hits:\*\*.*?(?=\n\n[A-Z]|Dear|To the|With over)', re.DOTALL)
+_QUICK_HITS_BULLET_RE = re.compile(r'\* ([^*]+?)(?=\*|$)', re.DOTALL)
+# The LLM's own closing lines - all removed in one pass before the configured signature is appended
+_SIG_RE = re.compile(r'\n(?:thanks|Best regards|Sincerely),\s*\n+.*?(?=\n\n|\Z)', re.DOTALL | re.IGNORECASE)
+# Runs of 3+ newlines or 2+ spaces, collapsed in one pass
+_EXCESS_WHITESPACE_RE = re.compile(r'\n{3,}| {2,}')
+
+# google.api_core exception names worth retrying (matched by name to keep the import optional)
+_TRANSIENT_API_ERRORS = {'DeadlineExceeded', 'ServiceUnavailable', 'InternalServerError', 'TooManyRequests', 'ResourceExhausted'}
+
+def _is_transient_api_error(error):
+    """True for timeouts and server-side API errors that are worth retrying."""
+    # asyncio.wait_for raises asyncio.TimeoutError, which is only the builtin TimeoutError from Python 3.11
+    return isinstance(error, (TimeoutError, asyncio.TimeoutError)) or type(error).__name__ in _TRANSIENT_API_ERRORS
+
+def _api_backoff(attempt):
+    """Full-jitter exponential backoff delay (seconds) before retry number `attempt`."""
+    return random.uniform(0, min(8.0, 2 ** attempt))
+
+class _RateLimiter:
+    """Spaces requests evenly so a requests-per-minute quota is never exceeded (thread-safe)."""
+    
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self):
+        """Claim the next request slot; returns the seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+# Shared round-robin position over the configured local LLM hosts, so
+# short-lived generators still spread their requests across every node
+_HOST_COUNTER = itertools.count()
+# Same for the configured API keys (e.g. GEMINI_API_KEYS)
+_API_KEY_COUNTER = itertools.count()
+# Ollama stops decoding at the letter's own closing line - post-processing
+# appends the real signature, so nothing after it is ever kept
+_SIGNATURE_STOP_SEQUENCES = ["\nSincerely,", "\nBest regards,", "\nthanks,", "\nThanks,"]
+# A closing line followed by a completed name line - the letter is finished and
+# anything after it is replaced by the configured signature in post-processing
+_SIGNATURE_END_RE = re.compile(r'\n[ \t]*(?:thanks|best regards|sincerely),[ \t]*\n+[ \t]*\S[^\n]*\n', re.IGNORECASE)
+
+_SYSTEM_PROMPT = """You are an expert career coach and professional writer specializing in creating compelling, personalized cover letters for technology executives and senior professionals.
+
+Your task is to analyze a candidate's resume and a specific job posting to create a highly tailored, engaging cover letter that:
+
+1. DEMONSTRATES CLEAR VALUE MATCH: Shows exactly how the candidate's experience aligns with the job requirements
+2. TELLS A COMPELLING STORY: Weaves together the candidate's background into a narrative that leads naturally to this role
+3. SHOWS DEEP RESEARCH: References specific aspects of the company and role that show genuine interest
+4. QUANTIFIES IMPACT: Includes specific achievements and metrics where available
+5. MAINTAINS PROFESSIONAL TONE: Confident but not arrogant, enthusiastic but not desperate
+
+STRUCTURE REQUIREMENTS:
+- Professional business letter format
+- Engaging opening that hooks the reader
+- 2-3 body paragraphs that build a compelling case
+- Strong closing that invites action
+- Professional signature block
+
+TONE REQUIREMENTS:
+- Confident and professional
+- Specific and achievement-focused  
+- Enthusiastic about the opportunity
+- Authentic and human (not robotic)
+
+AVOID:
+- Generic template language
+- Clichés and overused phrases
+- Repeating the entire resume
+- Desperate or begging tone
+- Overly long sentences or paragraphs"""
+
+# Full cover letter prompt; filled in by _build_cover_letter_prompt. Everything
+# that is the same for every job (system prompt, candidate, resume, instructions)
+# comes first, so Ollama reuses its cached prefill of that prefix across a batch
+# and only evaluates the job-specific tail
+_PROMPT_TEMPLATE = _SYSTEM_PROMPT + """
+
+**CANDIDATE INFORMATION:**
+Name: {name}
+Email: {email}
+Current/Recent Title: {current_title}
+Years of Experience: {years_experience}+ years
+
+**CANDIDATE'S FULL RESUME:**
+{resume_text}
+
+**ADDITIONAL INSTRUCTIONS:**
+{instructions}
+
+**JOB DETAILS:**
+Position: {job_title}
+Company: {company}
+Location: {location}
+
+**JOB DESCRIPTION:**
+{job_description}
+
+**YOUR TASK:**
+Create a personalized, compelling cover letter that:
+1. Opens with an engaging hook that immediately shows value alignment
+2. Demonstrates specific understanding of the role and company
+3. Tells the story of why this candidate is uniquely qualified
+4. Includes specific achievements and quantifiable results from their background
+5. Shows genuine enthusiasm for the opportunity
+6. Ends with a confident call to action
+
+The cover letter should be approximately 300-400 words and feel authentic and human, not like a generic template. Make it feel like it was written specifically for this role at this company.
+
+Please write the complete cover letter now:"""
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode('utf-8')
+
+# Generated letters are cached alongside the extraction cache. With 'auto' only
+# near-deterministic settings (temperature <= 0.2) are cached - at higher
+# temperatures a repeat run is expected to produce a fresh letter
+LLM_CACHE_DIR = os.getenv('LLM_CACHE_DIR', '.llm_cache')
+LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', str(7 * 24 * 3600)))  # seconds
+COVER_LETTER_CACHE = os.getenv('COVER_LETTER_CACHE', 'auto').lower()
+
+def _cache_get(key):
+    """Return a cached response, or None when missing or older than LLM_CACHE_TTL."""
+    path = os.path.join(LLM_CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > LLM_CACHE_TTL:
+            return None
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _cache_set(key, value):
+    """Atomically store a response in the cache; failures are non-fatal."""
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=LLM_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(value))
+        os.replace(tmp_path, os.path.join(LLM_CACHE_DIR, f"{key}.json"))
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"   ⚠️ Could not write cover letter cache: {e}")
+
+def _extract_email(text):
+    """
+    Return the first email address in text, or None.
+    
+    Finds each '@' with str.find and expands outwards over the allowed
+    characters instead of running a backtracking regex over the whole resume.
+    """
+    at = text.find('@')
+    while at != -1:
+        start = at
+        while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            start -= 1
+        end = at + 1
+        while end < len(text) and text[end] in _EMAIL_DOMAIN_CHARS:
+            end += 1
+        
+        # Trailing punctuation isn't part of the address; the TLD must be 2+ letters
+        domain = text[at + 1:end].rstrip('.-')
+        host, _, tld = domain.rpartition('.')
+        if start < at and host and len(tld) >= 2 and tld.isalpha():
+            return text[start:at + 1 + len(domain)]
+        at = text.find('@', at + 1)
+    return None
+
+@functools.lru_cache(maxsize=8)
+def _scan_candidate_info(resume_text):
+    """
+    Extract key candidate information from resume text.
+    
+    Cached because batch runs pair the same resume with every job; returns an
+    immutable tuple of (key, value) items for callers to copy into a dict.
+    """
+    candidate_info = {
+        'name': 'Candidate',
+        'email': 'candidate@email.com',
+        'phone': '',
+        'linkedin': '',
+        'years_experience': 0,
+        'current_title': '',
+        'key_skills': (),
+        'top_achievements': ()
+    }
+    
+    # Extract name (usually first substantial line) - only the first five
+    # non-empty lines are looked at, so the rest of the resume isn't split
+    head_lines = filter(None, (raw_line.strip() for raw_line in io.StringIO(resume_text)))
+    for line in itertools.islice(head_lines, 5):
+        words = line.split()
+        if 2 <= len(words) <= 3:
+            lowered = line.lower()
+            if any(keyword in lowered for keyword in _NAME_REJECT_KEYWORDS):
+                continue
+            candidate_info['name'] = line
+            break
+    
+    # Extract email
+    email = _extract_email(resume_text)
+    if email:
+        candidate_info['email'] = email
+    
+    # Extract phone
+    phone_match = _PHONE_RE.search(resume_text)
+    if phone_match:
+        candidate_info['phone'] = phone_match.group()
+    
+    # Extract LinkedIn
+    linkedin_match = _LINKEDIN_RE.search(resume_text)
+    if linkedin_match:
+        candidate_info['linkedin'] = linkedin_match.group(1)
+    
+    # Extract years of experience - the largest plausible figure (under 60)
+    for match in _YEARS_RE.finditer(resume_text):
+        years = int(match.group(1))
+        if candidate_info['years_experience'] < years < 60:
+            candidate_info['years_experience'] = years
+    
+    # Extract current/most recent title
+    for title_re in _TITLE_RES:
+        match = title_re.search(resume_text)
+        if match:
+            candidate_info['current_title'] = match.group().strip()
+            break
+    
+    return tuple(candidate_info.items())
+
+def _gemini_model(genai, model_name, api_key):
+    """
+    GenerativeModel bound to api_key.
+    
+    genai.configure() sets one process-wide key that a model only picks up on
+    its first call, so the job processor and the cover letter generator would
+    otherwise share whichever key was configured last. Each model is pinned to
+    the clients built while its own key is configured. GenerativeModel._client
+    and _async_client are SDK internals, which is why google-generativeai is
+    pinned in requirements.txt - recheck this when upgrading it.
+    """
+    from google.generativeai import client as genai_client
+    genai.configure(api_key=api_key)
+    model_client = genai.GenerativeModel(model_name)
+    model_client._client = genai_client.get_default_generative_client()
+    model_client._async_client = genai_client.get_default_generative_async_client()
+    return model_client
+
+def _job_description_text(job_info):
+    """Job description for the prompt, flagged when only a condensed summary was extracted."""
+    description = job_info.get('description')
+    if not description:
+        return 'Job description not available - please create a cover letter based on the position title and company.'
+    if job_info.get('description_is_summary'):
+        return f"(Summary condensed from the job page - the full posting text was not available)\n{description}"
+    return description
+
+# Longest resume (characters) embedded in the cover letter prompt; 0 sends it whole
+RESUME_MAX_CHARS = int(os.getenv('RESUME_MAX_CHARS', '8000'))
+# Splits a resume before each all-caps section heading line (e.g. "PROFESSIONAL EXPERIENCE")
+_RESUME_SECTION_SPLIT_RE = re.compile(r'\n(?=[ \t]*[A-Z][A-Z &/]{3,}:?[ \t]*\n)')
+# Sections kept first when a long resume has to be trimmed
+_RESUME_PRIORITY_SECTIONS = ('EXPERIENCE', 'EMPLOYMENT', 'SKILL', 'SUMMARY', 'PROFILE')
+
+@functools.lru_cache(maxsize=8)
+def _trim_resume(resume_text, max_chars=RESUME_MAX_CHARS):
+    """
+    Fit a long resume into max_chars for the prompt. The header (name/contact)
+    is always kept, then experience/skills/summary sections, then the rest in
+    order while they fit; kept sections stay in their original order.
+    """
+    if not max_chars or len(resume_text) <= max_chars:
+        return resume_text
+    
+    sections = _RESUME_SECTION_SPLIT_RE.split(resume_text)
+    if len(sections[0]) > max_chars:
+        # No usable headings - keep the top of the resume
+        return resume_text[:max_chars]
+    
+    def is_priority(index):
+        heading = sections[index].lstrip().partition('\n')[0].upper()
+        return any(keyword in heading for keyword in _RESUME_PRIORITY_SECTIONS)
+    
+    kept = [0]
+    budget = max_chars - len(sections[0])
+    for index in sorted(range(1, len(sections)), key=lambda index: not is_priority(index)):
+        if len(sections[index]) + 1 <= budget:
+            kept.append(index)
+            budget -= len(sections[index]) + 1
+    return '\n'.join(sections[index] for index in sorted(kept))
+
 class LLMCoverLetterGenerator:
     """Generates personalized cover letters using dynamic Tier 1 LLM providers"""
     
+    # API clients shared by every generator in the process, keyed by (provider, model, api key)
+    _client_cache = {}
+    
     def __init__(self):
         """Initialize the LLM generator with dynamic tier configuration"""
         # Use Tier 1 for cover letter generation (high quality)
@@ -24,10 +366,55 @@ class LLMCoverLetterGenerator:
             
         self.tier1_provider = self.tier1_provider.lower()
         
+        # One keep-alive session for the connection test and every generation
+        # request instead of a fresh TCP connection per call
+        self._session = requests.Session()
+        self._session.headers['Connection'] = 'keep-alive'
+        self._mount_connection_pool(8)
+        # Worker threads for blocking Tier 1 calls made from the async path, sized
+        # separately from the event loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=int(os.getenv('TIER1_CONCURRENCY', '16')))
+        
         # Initialize Tier 1 configuration dynamically
-        self._init_tier1_config()
+        try:
+            self._init_tier1_config()
+        except Exception:
+            self.close()
+            raise
+        
+        logger.info(f"   🎯 Tier 1 LLM (Cover Letter Generation): {self.tier1_provider}")
+    
+    def _mount_connection_pool(self, num_hosts):
+        """
+        Pool keep-alive connections for up to num_hosts LLM hosts.
         
-        print(f"   🎯 Tier 1 LLM (Cover Letter Generation): {self.tier1_provider}")
+        Connection failures and gateway errors (model still loading, a node
+        restarting) are retried with backoff before the request fails. Read
+        timeouts are not: the generation POST may already be running on the
+        server, and replaying it would queue the same letter again.
+        """
+        retries = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=['GET', 'POST'],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=num_hosts, pool_maxsize=16, max_retries=retries)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+    
+    def close(self):
+        """Close the pooled HTTP connections and the async path's worker threads."""
+        self._session.close()
+        self._executor.shutdown(wait=False)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def _init_tier1_config(self):
         """Dynamically initialize Tier 1 LLM configuration based on .env file."""
@@ -41,60 +428,120 @@ class LLMCoverLetterGenerator:
         
         # Check if this is an API-based service or local service
         api_key = os.getenv(api_key_key)
+        # Optional comma-separated list of API keys (e.g. GEMINI_API_KEYS) to spread
+        # requests across, so a batch isn't held to a single key's rate limit
+        api_keys = [key.strip() for key in os.getenv(f'{provider_upper}_API_KEYS', '').split(',') if key.strip()]
         base_url = os.getenv(base_url_key) or os.getenv(host_key)
+        # Optional comma-separated list of nodes (e.g. OLLAMA_HOSTS) to spread
+        # cover letter requests across
+        hosts = [host.strip().rstrip('/') for host in os.getenv(f'{provider_upper}_HOSTS', '').split(',') if host.strip()]
         model = os.getenv(model_key)
         
-        if api_key:
+        if api_key or api_keys:
             # API-based service
-            self.tier1_api_key = api_key
+            self.tier1_api_keys = api_keys or [api_key]
+            self.tier1_api_key = self.tier1_api_keys[0]
             self.tier1_model = model or f'{self.tier1_provider}-default'
+            self.temperature = float(os.getenv(f'{provider_upper}_TEMPERATURE', '0.7'))
+            # Bound every call so a stalled request is retried instead of hanging the run
+            self.max_tokens = int(os.getenv('TIER1_MAX_OUTPUT_TOKENS', '1200'))
+            self.timeout = float(os.getenv('TIER1_TIMEOUT', '60'))
+            self.max_retries = int(os.getenv('TIER1_MAX_RETRIES', '2'))
+            # Requests per minute allowed per API key - calls are paced to stay under
+            # the quota instead of bursting into 429s and backing off
+            self._rate_limiter = _RateLimiter(int(os.getenv('TIER1_RPM', '60')) * len(self.tier1_api_keys))
             
             # Initialize API client dynamically
             if 'gemini' in self.tier1_provider.lower():
                 try:
                     import google.generativeai as genai
-                    genai.configure(api_key=api_key)
-                    self.tier1_client = genai.GenerativeModel(model or 'gemini-1.5-flash')
-                    print(f"   ✅ {self.tier1_provider.title()} connected - using model: {self.tier1_model}")
+                    model_name = model or 'gemini-1.5-flash'
+                    self.tier1_clients = [self._gemini_client(genai, model_name, key) for key in self.tier1_api_keys]
+                    self.tier1_client = self.tier1_clients[0]
+                    keys = f" across {len(self.tier1_clients)} API keys" if len(self.tier1_clients) > 1 else ""
+                    logger.info(f"   ✅ {self.tier1_provider.title()} connected - using model: {self.tier1_model}{keys}")
                 except ImportError:
                     raise ValueError("google-generativeai package is required. Install with: pip install google-generativeai")
                 except Exception as e:
                     raise ValueError(f"Failed to initialize {self.tier1_provider}: {e}")
             # Add other API providers here as needed
             
-        elif base_url:
+        elif base_url or hosts:
             # Local/self-hosted service
-            self.tier1_base_url = base_url
+            self.tier1_base_urls = hosts or [base_url]
+            self.tier1_base_url = self.tier1_base_urls[0]
             self.tier1_model = model
             self.temperature = float(os.getenv(f'{provider_upper}_TEMPERATURE', '0.7'))
-            self.max_tokens = int(os.getenv(f'{provider_upper}_MAX_TOKENS', '2000'))
+            # A 300-400 word letter plus Quick Hits is ~650 tokens; the cap stops a
+            # rambling model from decoding far past the letter
+            self.max_tokens = int(os.getenv(f'{provider_upper}_MAX_TOKENS', '800'))
+            # Keep the model loaded between letters so batch runs don't pay a reload
+            self.keep_alive = os.getenv(f'{provider_upper}_KEEP_ALIVE', '30m')
+            # Longest silence (seconds) allowed while streaming - covers prompt evaluation
+            # before the first token, then catches a stalled model mid-letter
+            self.stream_timeout = float(os.getenv(f'{provider_upper}_STREAM_TIMEOUT', '60'))
             
             if not model:
                 raise ValueError(f"{model_key} must be set in .env file")
             
+            # Keep a warm connection pool per node
+            if len(self.tier1_base_urls) > 8:
+                self._mount_connection_pool(len(self.tier1_base_urls))
+            
             # Test connection for local services
             self._test_local_connection()
             
         else:
             raise ValueError(f"No valid configuration found for {self.tier1_provider}. Need either {api_key_key} or {base_url_key}/{host_key} in .env file")
     
+    def _gemini_client(self, genai, model_name, api_key):
+        """GenerativeModel for api_key, shared by every generator in the process"""
+        client_key = (self.tier1_provider, model_name, api_key)
+        if client_key not in self._client_cache:
+            self._client_cache[client_key] = _gemini_model(genai, model_name, api_key)
+        return self._client_cache[client_key]
+    
+    def _next_api_client(self):
+        """Pick the API client for the next request (round-robin over the configured keys)"""
+        return self.tier1_clients[next(_API_KEY_COUNTER) % len(self.tier1_clients)]
+    
     def _test_local_connection(self):
-        """Test connection to local LLM service"""
-        try:
-            response = requests.get(f"{self.tier1_base_url}/api/tags", timeout=5)
-            if response.status_code == 200:
-                models = response.json().get('models', [])
+        """Test connection to each local LLM node; unreachable nodes are dropped"""
+        reachable = []
+        last_error = None
+        for base_url in self.tier1_base_urls:
+            try:
+                response = self._session.get(f"{base_url}/api/tags", timeout=5)
+                if response.status_code != 200:
+                    raise Exception(f"Local LLM API returned status {response.status_code}")
+                models = _json_loads(response.content).get('models', [])
+            except Exception as e:
+                last_error = e
+                if len(self.tier1_base_urls) > 1:
+                    logger.warning(f"   ⚠️ Skipping {self.tier1_provider} node {base_url}: {e}")
+                continue
+            
+            # Nodes are expected to serve the same models - check against the first
+            if not reachable:
                 available_models = [model['name'] for model in models]
                 if self.tier1_model not in available_models:
-                    print(f"   ⚠️ Model '{self.tier1_model}' not found. Available models: {available_models}")
+                    logger.warning(f"   ⚠️ Model '{self.tier1_model}' not found. Available models: {available_models}")
                     if available_models:
                         self.tier1_model = available_models[0]
-                        print(f"   🔄 Using {self.tier1_model} instead")
-                print(f"   ✅ {self.tier1_provider.title()} connected - using model: {self.tier1_model}")
-            else:
-                raise Exception(f"Local LLM API returned status {response.status_code}")
-        except Exception as e:
-            raise ValueError(f"Cannot connect to {self.tier1_provider} at {self.tier1_base_url}. Make sure service is running. Error: {e}")
+                        logger.info(f"   🔄 Using {self.tier1_model} instead")
+            reachable.append(base_url)
+        
+        if not reachable:
+            raise ValueError(f"Cannot connect to {self.tier1_provider} at {', '.join(self.tier1_base_urls)}. Make sure service is running. Error: {last_error}")
+        
+        self.tier1_base_urls = reachable
+        self.tier1_base_url = reachable[0]
+        nodes = f" on {len(reachable)} nodes" if len(reachable) > 1 else ""
+        logger.info(f"   ✅ {self.tier1_provider.title()} connected - using model: {self.tier1_model}{nodes}")
+    
+    def _next_base_url(self):
+        """Pick the local LLM node for the next request (round-robin)"""
+        return self.tier1_base_urls[next(_HOST_COUNTER) % len(self.tier1_base_urls)]
     
     def generate_cover_letter(self, resume_text, job_info, instructions=""):
         """
@@ -120,11 +567,15 @@ class LLMCoverLetterGenerator:
                 instructions
             )
             
-            # Generate cover letter using dynamic LLM
-            response = self._call_tier1_llm(prompt)
-            
+            # Generate cover letter using dynamic LLM (repeat prompts come from the cache)
+            cache_key = self._response_cache_key(prompt)
+            response = self._cached_response(cache_key)
             if not response:
-                raise Exception("Empty response from LLM")
+                response = self._call_tier1_llm(prompt)
+                if not response:
+                    raise Exception("Empty response from LLM")
+                if cache_key:
+                    _cache_set(cache_key, response)
             
             # Post-process the cover letter
             cover_letter = self._post_process_cover_letter(response, candidate_info)
@@ -132,9 +583,88 @@ class LLMCoverLetterGenerator:
             return cover_letter
             
         except Exception as e:
-            print(f"❌ Error generating cover letter with {self.tier1_provider}: {e}")
+            logger.error(f"❌ Error generating cover letter with {self.tier1_provider}: {e}")
             raise
     
+    async def generate_cover_letter_async(self, resume_text, job_info, instructions=""):
+        """
+        Async variant of generate_cover_letter - the LLM call doesn't block the event loop
+        
+        Returns:
+            str: Generated cover letter
+        """
+        try:
+            candidate_info = self._extract_candidate_info(resume_text)
+            prompt = self._build_cover_letter_prompt(candidate_info, resume_text, job_info, instructions)
+            
+            cache_key = self._response_cache_key(prompt)
+            response = self._cached_response(cache_key)
+            if not response:
+                response = await self._call_tier1_llm_async(prompt)
+                if not response:
+                    raise Exception("Empty response from LLM")
+                if cache_key:
+                    _cache_set(cache_key, response)
+            
+            return self._post_process_cover_letter(response, candidate_info)
+            
+        except Exception as e:
+            logger.error(f"❌ Error generating cover letter with {self.tier1_provider}: {e}")
+            raise
+    
+    def _response_cache_key(self, prompt):
+        """Cache key for a Tier 1 response to prompt, or None when this response shouldn't be cached"""
+        temperature = getattr(self, 'temperature', None)
+        if COVER_LETTER_CACHE in ('0', 'false', 'off'):
+            return None
+        if COVER_LETTER_CACHE == 'auto' and (temperature is None or temperature > 0.2):
+            return None
+        digest = hashlib.sha256(_json_dumps([self.tier1_provider, self.tier1_model, temperature, getattr(self, 'max_tokens', None)]))
+        digest.update(prompt.encode('utf-8'))
+        return f"coverletter_{digest.hexdigest()}"
+    
+    def _cached_response(self, cache_key):
+        """Return the cached Tier 1 response for cache_key, else None"""
+        response = _cache_get(cache_key) if cache_key else None
+        if response:
+            logger.info(f"   ♻️ Using cached cover letter response")
+        return response
+    
+    async def generate_many(self, resume_text, job_infos, instructions=""):
+        """
+        Generate cover letters for several jobs concurrently
+        
+        Returns:
+            list: cover letter per job in job_infos order - the Exception instead
+            for a job that failed, so one failure doesn't discard the others
+        """
+        return await asyncio.gather(
+            *(self.generate_cover_letter_async(resume_text, job_info, instructions) for job_info in job_infos),
+            return_exceptions=True
+        )
+    
+    async def _call_tier1_llm_async(self, prompt):
+        """Call Tier 1 natively when the API client is async-capable, else in a worker thread"""
+        client = getattr(self, 'tier1_client', None)
+        # Only the key-pinned sync clients rotate keys, so several keys run in worker threads
+        if hasattr(self, 'tier1_api_key') and len(self.tier1_api_keys) == 1 and hasattr(client, 'generate_content_async'):
+            for attempt in range(1, self.max_retries + 2):
+                try:
+                    await asyncio.sleep(self._rate_limiter.reserve())
+                    response = await asyncio.wait_for(
+                        client.generate_content_async(prompt, **self._api_request_options()),
+                        timeout=self.timeout
+                    )
+                    return self._api_response_text(response)
+                except Exception as e:
+                    if attempt > self.max_retries or not _is_transient_api_error(e):
+                        logger.warning(f"   ⚠️ Tier 1 LLM ({self.tier1_provider}) call failed: {e}")
+                        raise Exception(f"Failed to call API service: {e}")
+                    logger.warning(f"   ⚠️ Tier 1 API attempt {attempt} failed ({type(e).__name__}) - retrying")
+                    await asyncio.sleep(_api_backoff(attempt))
+        # The streaming local call (and sync-only API clients) run off the event loop
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._call_tier1_llm, prompt)
+    
     def _call_tier1_llm(self, prompt):
         """Dynamically call Tier 1 LLM based on configuration"""
         try:
@@ -149,195 +679,129 @@ class LLMCoverLetterGenerator:
                 raise ValueError(f"No valid configuration found for Tier 1 ({self.tier1_provider})")
                 
         except Exception as e:
-            print(f"   ⚠️ Tier 1 LLM ({self.tier1_provider}) call failed: {e}")
+            logger.warning(f"   ⚠️ Tier 1 LLM ({self.tier1_provider}) call failed: {e}")
             raise
     
     def _call_api_service(self, prompt):
         """Call an API-based LLM service"""
         if hasattr(self, 'tier1_client') and hasattr(self.tier1_client, 'generate_content'):
-            # This looks like a Google Generative AI client
-            try:
-                response = self.tier1_client.generate_content(prompt)
-                
-                if response.text:
-                    return response.text.strip()
-                else:
-                    raise Exception("API returned empty response")
-                    
-            except Exception as e:
-                raise Exception(f"Failed to call API service: {e}")
+            # This looks like a Google Generative AI client; a stuck request is
+            # abandoned after TIER1_TIMEOUT and retried up to TIER1_MAX_RETRIES times
+            for attempt in range(1, self.max_retries + 2):
+                try:
+                    time.sleep(self._rate_limiter.reserve())
+                    response = self._next_api_client().generate_content(prompt, **self._api_request_options())
+                    return self._api_response_text(response)
+                except Exception as e:
+                    if attempt > self.max_retries or not _is_transient_api_error(e):
+                        raise Exception(f"Failed to call API service: {e}")
+                    logger.warning(f"   ⚠️ Tier 1 API attempt {attempt} failed ({type(e).__name__}) - retrying")
+                    time.sleep(_api_backoff(attempt))
         else:
             raise Exception(f"Unsupported API client for {self.tier1_provider}")
     
+    def _api_request_options(self):
+        """Generation limits and per-request timeout for an API call"""
+        return {
+            'generation_config': {'temperature': self.temperature, 'max_output_tokens': self.max_tokens},
+            'request_options': {'timeout': self.timeout},
+        }
+    
+    def _api_response_text(self, response):
+        """Return the stripped text of an API response, raising when it is empty"""
+        if not response.text:
+            raise Exception("API returned empty response")
+        return response.text.strip()
+    
     def _call_local_service(self, prompt):
         """Call a local LLM service"""
         try:
             payload = {
                 "model": self.tier1_model,
                 "prompt": prompt,
-                "stream": False,
+                "stream": True,
+                "keep_alive": self.keep_alive,
                 "options": {
                     "temperature": self.temperature,
-                    "num_predict": self.max_tokens
+                    "num_predict": self.max_tokens,
+                    "stop": _SIGNATURE_STOP_SEQUENCES
                 }
             }
             
-            response = requests.post(
-                f"{self.tier1_base_url}/api/generate",
-                json=payload,
-                timeout=120  # Allow up to 2 minutes for generation
-            )
+            # Stream the letter as it is generated; the read timeout then applies between
+            # chunks, so a long letter isn't cut off while the model is still writing
+            # but a model that goes silent fails after stream_timeout
+            with self._session.post(
+                f"{self._next_base_url()}/api/generate",
+                data=_json_dumps(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=(10, self.stream_timeout),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    raise Exception(f"Local LLM API error: {response.status_code} - {response.text}")
+                
+                chunks = []
+                for line in self._iter_stream_lines(response):
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if chunk.get('error'):
+                        raise Exception(chunk['error'])
+                    piece = chunk.get('response', '')
+                    chunks.append(piece)
+                    if chunk.get('done'):
+                        break
+                    # Stop decoding once the signature is written - closing the
+                    # stream makes Ollama abandon the rest of the generation
+                    if '\n' in piece and _SIGNATURE_END_RE.search(''.join(chunks)):
+                        break
             
-            if response.status_code == 200:
-                result = response.json()
-                return result.get('response', '').strip()
-            else:
-                raise Exception(f"Local LLM API error: {response.status_code} - {response.text}")
+            return ''.join(chunks).strip()
                 
         except requests.exceptions.Timeout:
-            raise Exception("Local LLM request timed out - the model may be too slow or the prompt too complex")
+            raise Exception(f"Local LLM produced no output for {self.stream_timeout:g}s - the model may be stalled, too slow or the prompt too complex")
         except Exception as e:
             raise Exception(f"Failed to call local LLM API: {e}")
     
+    @staticmethod
+    def _iter_stream_lines(response):
+        """Iterate a streaming response's lines, reporting a mid-stream read stall as a Timeout"""
+        try:
+            yield from response.iter_lines()
+        except requests.exceptions.ConnectionError as e:
+            # requests surfaces a read timeout while streaming as a ConnectionError
+            raise requests.exceptions.Timeout(e)
+    
     def _extract_candidate_info(self, resume_text):
-        """Extract key candidate information from resume"""
-        candidate_info = {
-            'name': 'Candidate',
-            'email': 'candidate@email.com',
-            'phone': '',
-            'linkedin': '',
-            'years_experience': 0,
-            'current_title': '',
-            'key_skills': [],
-            'top_achievements': []
-        }
-        
-        # Extract name (usually first substantial line)
-        lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
-        for line in lines[:5]:
-            words = line.split()
-            if (2 <= len(words) <= 3 and 
-                not any(keyword in line.lower() for keyword in ['phone', 'email', '@', 'linkedin', 'experience'])):
-                candidate_info['name'] = line
-                break
-        
-        # Extract email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_text)
-        if email_match:
-            candidate_info['email'] = email_match.group()
-        
-        # Extract phone
-        phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', resume_text)
-        if phone_match:
-            candidate_info['phone'] = phone_match.group()
-        
-        # Extract LinkedIn
-        linkedin_match = re.search(r'(https?://(?:www\.)?linkedin\.com/in/[^\s]+)', resume_text, re.IGNORECASE)
-        if linkedin_match:
-            candidate_info['linkedin'] = linkedin_match.group(1)
-        
-        # Extract years of experience
-        years_matches = re.findall(r'(\d+)[+]?\s*years?', resume_text, re.IGNORECASE)
-        if years_matches:
-            candidate_info['years_experience'] = max([int(y) for y in years_matches])
-        
-        # Extract current/most recent title
-        title_patterns = [
-            r'(?:VP|Vice President|Director|Senior|Lead|Principal|Chief)\s+[A-Za-z\s]+',
-            r'(?:Software|Engineering|Technology|Product)\s+(?:Manager|Director|Lead|Engineer)'
-        ]
-        for pattern in title_patterns:
-            match = re.search(pattern, resume_text, re.IGNORECASE)
-            if match:
-                candidate_info['current_title'] = match.group().strip()
-                break
-        
-        return candidate_info
+        """Extract key candidate information from resume (scanned once per distinct resume)"""
+        return dict(_scan_candidate_info(resume_text))
     
     def _get_system_prompt(self):
         """Get the system prompt for the LLM - now integrated into the main prompt"""
-        return """You are an expert career coach and professional writer specializing in creating compelling, personalized cover letters for technology executives and senior professionals.
-
-Your task is to analyze a candidate's resume and a specific job posting to create a highly tailored, engaging cover letter that:
-
-1. DEMONSTRATES CLEAR VALUE MATCH: Shows exactly how the candidate's experience aligns with the job requirements
-2. TELLS A COMPELLING STORY: Weaves together the candidate's background into a narrative that leads naturally to this role
-3. SHOWS DEEP RESEARCH: References specific aspects of the company and role that show genuine interest
-4. QUANTIFIES IMPACT: Includes specific achievements and metrics where available
-5. MAINTAINS PROFESSIONAL TONE: Confident but not arrogant, enthusiastic but not desperate
-
-STRUCTURE REQUIREMENTS:
-- Professional business letter format
-- Engaging opening that hooks the reader
-- 2-3 body paragraphs that build a compelling case
-- Strong closing that invites action
-- Professional signature block
-
-TONE REQUIREMENTS:
-- Confident and professional
-- Specific and achievement-focused  
-- Enthusiastic about the opportunity
-- Authentic and human (not robotic)
-
-AVOID:
-- Generic template language
-- Clichés and overused phrases
-- Repeating the entire resume
-- Desperate or begging tone
-- Overly long sentences or paragraphs"""
+        return _SYSTEM_PROMPT
     
     def _build_cover_letter_prompt(self, candidate_info, resume_text, job_info, instructions):
         """Build the prompt for cover letter generation"""
-        
-        job_title = job_info.get('job_title', 'the position')
-        company = job_info.get('company', 'the company')
-        job_description = job_info.get('description', '')
-        
-        # For local services, combine system and user prompts
-        system_prompt = self._get_system_prompt()
-        
-        prompt = f"""{system_prompt}
-
-**CANDIDATE INFORMATION:**
-Name: {candidate_info['name']}
-Email: {candidate_info['email']}
-Current/Recent Title: {candidate_info.get('current_title', 'Senior Professional')}
-Years of Experience: {candidate_info['years_experience']}+ years
-
-**JOB DETAILS:**
-Position: {job_title}
-Company: {company}
-Location: {job_info.get('location', 'Various')}
-
-**JOB DESCRIPTION:**
-{job_description if job_description else 'Job description not available - please create a cover letter based on the position title and company.'}
-
-**CANDIDATE'S FULL RESUME:**
-{resume_text}
-
-**ADDITIONAL INSTRUCTIONS:**
-{instructions if instructions else 'No additional instructions provided.'}
-
-**YOUR TASK:**
-Create a personalized, compelling cover letter that:
-1. Opens with an engaging hook that immediately shows value alignment
-2. Demonstrates specific understanding of the role and company
-3. Tells the story of why this candidate is uniquely qualified
-4. Includes specific achievements and quantifiable results from their background
-5. Shows genuine enthusiasm for the opportunity
-6. Ends with a confident call to action
-
-The cover letter should be approximately 300-400 words and feel authentic and human, not like a generic template. Make it feel like it was written specifically for this role at this company.
-
-Please write the complete cover letter now:"""
-
-        return prompt
+        # For local services, system and user prompts are combined in one template
+        return _PROMPT_TEMPLATE.format_map({
+            'name': candidate_info['name'],
+            'email': candidate_info['email'],
+            'current_title': candidate_info.get('current_title', 'Senior Professional'),
+            'years_experience': candidate_info['years_experience'],
+            'job_title': job_info.get('job_title', 'the position'),
+            'company': job_info.get('company', 'the company'),
+            'location': job_info.get('location', 'Various'),
+            'job_description': _job_description_text(job_info),
+            'resume_text': _trim_resume(resume_text),
+            'instructions': instructions or 'No additional instructions provided.'
+        })
     
     def _post_process_cover_letter(self, cover_letter, candidate_info):
         """Post-process the generated cover letter"""
         
         # Remove LLM's introductory text (everything before Quick Hits or Dear)
-        lines = cover_letter.split('\n')
+        lines = cover_letter.splitlines()
         start_idx = 0
         
         for i, line in enumerate(lines):
@@ -357,54 +821,54 @@ Please write the complete cover letter now:"""
         # Fix Quick Hits formatting - ensure proper bold formatting and line breaks
         if '**Quick Hits:**' in cover_letter:
             # Find and replace the Quick Hits section
-            quick_hits_pattern = r'[\*\s]*\*\*Quick Hits:\*\*.*?(?=\n\n[A-Z]|Dear|To the|With over)'
-            match = re.search(quick_hits_pattern, cover_letter, re.DOTALL)
+            match = _QUICK_HITS_RE.search(cover_letter)
             if match:
                 quick_hits_text = match.group(0)
                 # Extract bullet points
-                bullets = re.findall(r'\* ([^*]+?)(?=\*|$)', quick_hits_text, re.DOTALL)
+                bullets = _QUICK_HITS_BULLET_RE.findall(quick_hits_text)
                 if bullets:
                     # Rebuild with proper formatting
-                    formatted_quick_hits = "**Quick Hits:**\n\n"
-                    for bullet in bullets:
-                        formatted_quick_hits += f"* {bullet.strip()}\n"
-                    formatted_quick_hits += "\n"
+                    formatted_quick_hits = ''.join(
+                        ["**Quick Hits:**\n\n"] + [f"* {bullet.strip()}\n" for bullet in bullets] + ["\n"]
+                    )
                     
                     # Replace in cover letter
                     cover_letter = cover_letter.replace(quick_hits_text, formatted_quick_hits)
         
         # Remove duplicate signatures and contact info
-        # Find all signatures (thanks, Best regards, Sincerely, etc.)
-        signature_patterns = [
-            r'\nthanks,\s*\n+.*?(?=\n\n|\Z)',
-            r'\nBest regards,\s*\n+.*?(?=\n\n|\Z)',
-            r'\nSincerely,\s*\n+.*?(?=\n\n|\Z)',
-        ]
-        
-        # Remove all existing signatures
-        for pattern in signature_patterns:
-            cover_letter = re.sub(pattern, '', cover_letter, flags=re.DOTALL | re.IGNORECASE)
+        # Remove all existing signatures (thanks, Best regards, Sincerely, etc.)
+        cover_letter = _SIG_RE.sub('', cover_letter)
         
-        # Add single, clean signature at the end
-        cover_letter = cover_letter.strip()
-        cover_letter += f"\n\nthanks,\n\n{candidate_info['name']}"
-        
-        # Add contact info once
-        contact_lines = []
+        # Add single, clean signature at the end, then contact info once
+        parts = [cover_letter.strip(), f"\n\nthanks,\n\n{candidate_info['name']}"]
         if candidate_info['email'] and candidate_info['email'] != 'candidate@email.com':
-            contact_lines.append(candidate_info['email'])
+            parts.append(f"\n{candidate_info['email']}")
         if candidate_info.get('linkedin'):
-            contact_lines.append(candidate_info['linkedin'])
-        
-        if contact_lines:
-            cover_letter += '\n' + '\n'.join(contact_lines)
+            parts.append(f"\n{candidate_info['linkedin']}")
+        cover_letter = ''.join(parts)
         
         # Clean up formatting issues
-        cover_letter = re.sub(r'\n{3,}', '\n\n', cover_letter)  # Limit to double line breaks
-        cover_letter = re.sub(r' +', ' ', cover_letter)  # Remove extra spaces
+        # Limit to double line breaks and remove extra spaces
+        cover_letter = _EXCESS_WHITESPACE_RE.sub(
+            lambda match: '\n\n' if match.group()[0] == '\n' else ' ', cover_letter
+        )
         
         return cover_letter.strip()
 
+@functools.lru_cache(maxsize=1)
+def _get_generator():
+    """Shared LLMCoverLetterGenerator so the provider client, connection check and HTTP session are set up once per run."""
+    return LLMCoverLetterGenerator()
+
+@functools.lru_cache(maxsize=4)
+def _load_instructions(instructions_path):
+    """Read a cover letter instructions file once per process; empty when it doesn't exist."""
+    try:
+        with open(instructions_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ""
+
 def generate_llm_cover_letter(resume_text, job_info, instructions_path=""):
     """
     Main function to generate LLM-powered cover letter using dynamic Tier 1 LLM
@@ -419,16 +883,10 @@ def generate_llm_cover_letter(resume_text, job_info, instructions_path=""):
     """
     try:
         # Load additional instructions if provided
-        instructions = ""
-        if instructions_path and os.path.exists(instructions_path):
-            with open(instructions_path, 'r', encoding='utf-8') as f:
-                instructions = f.read()
-        
-        # Initialize the LLM generator
-        generator = LLMCoverLetterGenerator()
+        instructions = _load_instructions(instructions_path) if instructions_path else ""
         
-        # Generate the cover letter
-        cover_letter = generator.generate_cover_letter(
+        # Generate the cover letter with the shared LLM generator
+        cover_letter = _get_generator().generate_cover_letter(
             resume_text=resume_text,
             job_info=job_info,
             instructions=instructions
@@ -437,19 +895,54 @@ def generate_llm_cover_letter(resume_text, job_info, instructions_path=""):
         return cover_letter, True
         
     except Exception as e:
-        print(f"❌ Error in LLM cover letter generation: {e}")
+        logger.error(f"❌ Error in LLM cover letter generation: {e}")
         raise
 
+def generate_llm_cover_letters(resume_text, job_infos, instructions_path="", max_workers=None):
+    """
+    Generate cover letters for several jobs concurrently
+    
+    The shared generator (and its pooled connections) serves all worker threads,
+    so requests reuse keep-alive sockets.
+    
+    Args:
+        resume_text (str): Full resume text
+        job_infos (list): Job information dicts
+        instructions_path (str): Path to instructions file (optional)
+        max_workers (int): Concurrent generations (defaults to 2 per local LLM node, or 4)
+        
+    Returns:
+        list: (cover_letter_text, success_flag) per job, in job_infos order -
+        a failed job yields (None, False) without stopping the others
+    """
+    instructions = _load_instructions(instructions_path) if instructions_path else ""
+    
+    generator = _get_generator()
+    
+    def generate(job_info):
+        try:
+            return generator.generate_cover_letter(resume_text, job_info, instructions), True
+        except Exception as e:
+            logger.error(f"❌ Cover letter generation failed for {job_info.get('company', 'Unknown')}: {e}")
+            return None, False
+    
+    if max_workers is None:
+        max_workers = 2 * len(getattr(generator, 'tier1_base_urls', ())) or 4
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(generate, job_infos))
+
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
+    
     # Test the dynamic LLM cover letter generator
-    print("🤖 Testing Dynamic LLM Cover Letter Generator")
+    logger.info("🤖 Testing Dynamic LLM Cover Letter Generator")
     
     # Check if LLM is configured
     try:
         generator = LLMCoverLetterGenerator()
-        print("✅ Dynamic LLM Cover Letter Generator ready")
+        logger.info("✅ Dynamic LLM Cover Letter Generator ready")
     except Exception as e:
-        print(f"❌ LLM setup error: {e}")
-        print("💡 Make sure your LLM provider is configured in .env file:")
-        print("   - For local services: Set TIER1_LLM_PROVIDER, {PROVIDER}_BASE_URL, {PROVIDER}_MODEL")
-        print("   - For API services: Set TIER1_LLM_PROVIDER, {PROVIDER}_API_KEY, {PROVIDER}_MODEL")
+        logger.error(f"❌ LLM setup error: {e}")
+        logger.info("💡 Make sure your LLM provider is configured in .env file:")
+        logger.info("   - For local services: Set TIER1_LLM_PROVIDER, {PROVIDER}_BASE_URL, {PROVIDER}_MODEL")
+        logger.info("   - For API services: Set TIER1_LLM_PROVIDER, {PROVIDER}_API_KEY, {PROVIDER}_MODEL")